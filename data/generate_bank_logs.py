@@ -1,12 +1,26 @@
-import random
+import argparse
 import datetime
 import json
-from typing import List, Dict
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from typing import List, Dict, Optional, Tuple, Union
+
+import numpy as np
 
 class BankingLogGenerator:
     """Generate realistic banking teller transaction logs for LSTM training"""
     
-    def __init__(self):
+    # Events' worth of per-event random columns drawn per refill
+    DRAW_BLOCK_SIZE = 4096
+    
+    def __init__(self, seed: Optional[Union[int, np.random.SeedSequence]] = None):
+        # Single NumPy generator; per-event columns are drawn in blocks and consumed in slices
+        self.rng = np.random.default_rng(seed)
+        self._event_block: Dict[str, List] = {}
+        self._event_block_size = 0
+        self._event_cursor = 0
         self.transaction_types = [
             "DEPOSIT", "WITHDRAWAL", "BALANCE_INQUIRY", "TRANSFER",
             "LOAN_PAYMENT", "CHECK_CASHING", "ACCOUNT_OPENING",
@@ -90,19 +104,85 @@ class BankingLogGenerator:
         self.tellers = [f"TELLER_{i:03d}" for i in range(1, 26)]
         self.branches = [f"BR_{i:04d}" for i in range(100, 120)]
         
+        # Per-event-name field flags, resolved once instead of substring-scanning every event:
+        # (needs_amount, needs_balance, is_update, is_debit)
+        event_names = {"OVERDRAFT_CHECK", "AMOUNT_RECOUNT"}
+        for sequence in [*self.event_sequences.values(), *self.anomalies.values()]:
+            event_names.update(sequence)
+        self._event_flags = {event: self._flags_for(event) for event in event_names}
+        self._auth_events = frozenset({"SESSION_START", "TELLER_LOGIN", "CUSTOMER_VERIFY"})
+    
+    @staticmethod
+    def _flags_for(event: str) -> Tuple[bool, bool, bool, bool]:
+        """Derive which optional fields an event name carries"""
+        return (
+            "AMOUNT" in event or "DEPOSIT" in event or "WITHDRAWAL" in event,
+            "BALANCE" in event,
+            "UPDATE" in event,
+            "DEBIT" in event or "WITHDRAWAL" in event,
+        )
+        
+    def _sample_event_block(self, size: int) -> Dict[str, List]:
+        """Draw ``size`` events' worth of every per-event random column"""
+        rng = self.rng
+        return {
+            "delay": rng.uniform(0.5, 3.5, size).tolist(),
+            "status": rng.random(size).tolist(),
+            "amount": rng.uniform(10.00, 50000.00, size).tolist(),
+            "balance": rng.uniform(100.00, 100000.00, size).tolist(),
+            "terminal": rng.integers(1, 51, size).tolist(),
+            "session": rng.integers(100000, 1000000, size).tolist(),
+            "octet_a": rng.integers(0, 256, size).tolist(),
+            "octet_b": rng.integers(0, 256, size).tolist(),
+            "host": rng.integers(1, 255, size).tolist(),
+        }
+    
+    def _take_event_draws(self, count: int) -> Dict[str, List]:
+        """Return the next ``count`` rows of per-event random columns, refilling as needed"""
+        if self._event_cursor + count > self._event_block_size:
+            size = max(self.DRAW_BLOCK_SIZE, count)
+            self._event_block = self._sample_event_block(size)
+            self._event_block_size = size
+            self._event_cursor = 0
+        start = self._event_cursor
+        self._event_cursor = start + count
+        return {name: column[start:start + count] for name, column in self._event_block.items()}
+    
     def generate_timestamp(self, base_time: datetime.datetime) -> str:
         """Generate realistic timestamp with microseconds"""
-        return base_time.strftime("%Y-%m-%d %H:%M:%S.%f")
+        # Same layout as strftime("%Y-%m-%d %H:%M:%S.%f") without parsing a format string
+        return base_time.isoformat(sep=" ", timespec="microseconds")
+    
+    def _event_timestamps(self, base_time: datetime.datetime, 
+                          offsets: List[float]) -> List[str]:
+        """Format ``base_time + offset`` (seconds) for each offset with integer microsecond math"""
+        day_us = ((base_time.hour * 60 + base_time.minute) * 60 + base_time.second) * 1_000_000 \
+            + base_time.microsecond
+        prefix = f"{base_time.year:04d}-{base_time.month:02d}-{base_time.day:02d} "
+        stamps = []
+        for offset in offsets:
+            us = day_us + round(offset * 1_000_000)
+            if us >= 86_400_000_000:
+                # Rolled past midnight: let datetime handle the calendar
+                stamps.append(self.generate_timestamp(
+                    base_time + datetime.timedelta(microseconds=us - day_us)))
+                continue
+            hours, rem = divmod(us, 3_600_000_000)
+            minutes, rem = divmod(rem, 60_000_000)
+            seconds, micros = divmod(rem, 1_000_000)
+            stamps.append("%s%02d:%02d:%02d.%06d" % (prefix, hours, minutes, seconds, micros))
+        return stamps
     
     def generate_transaction_log(self, trans_type: str, trans_id: str, 
                                  base_time: datetime.datetime, 
                                  is_anomaly: bool = False) -> List[Dict]:
         """Generate complete transaction log with all events"""
         logs = []
+        rng = self.rng
         
-        if is_anomaly and random.random() < 0.3:
+        if is_anomaly and rng.random() < 0.3:
             # Inject anomalous sequence
-            anomaly_type = random.choice(list(self.anomalies.keys()))
+            anomaly_type = list(self.anomalies.keys())[rng.integers(len(self.anomalies))]
             events = self.anomalies[anomaly_type]
             severity = "CRITICAL"
         else:
@@ -110,29 +190,45 @@ class BankingLogGenerator:
             severity = "INFO"
             
             # Occasionally add variations to normal flows
-            if random.random() < 0.15:
+            variations = rng.random(2)
+            if variations[0] < 0.15:
                 if "BALANCE_CHECK" in events:
                     idx = events.index("BALANCE_CHECK")
                     events.insert(idx + 1, "OVERDRAFT_CHECK")
             
-            if random.random() < 0.1 and "AMOUNT_VERIFY" in events:
+            if variations[1] < 0.1 and "AMOUNT_VERIFY" in events:
                 idx = events.index("AMOUNT_VERIFY")
                 events.insert(idx + 1, "AMOUNT_RECOUNT")
         
-        teller = random.choice(self.tellers)
-        branch = random.choice(self.branches)
-        customer_id = f"CUST_{random.randint(100000, 999999)}"
-        account_num = f"{random.randint(1000000000, 9999999999)}"
+        teller = self.tellers[rng.integers(len(self.tellers))]
+        branch = self.branches[rng.integers(len(self.branches))]
+        customer_id = f"CUST_{rng.integers(100000, 1000000)}"
+        account_num = f"{rng.integers(1000000000, 10000000000)}"
+        
+        # Per-event random columns come from the pre-drawn block
+        draws = self._take_event_draws(len(events))
+        # Add realistic time delays between events
+        timestamps = self._event_timestamps(base_time, list(accumulate(draws["delay"])))
+        status_draws = draws["status"]
+        amounts = draws["amount"]
+        balances = draws["balance"]
+        terminals = draws["terminal"]
+        sessions = draws["session"]
+        octets_a = draws["octet_a"]
+        octets_b = draws["octet_b"]
+        hosts = draws["host"]
         
-        current_time = base_time
+        event_flags = self._event_flags
+        auth_events = self._auth_events
         
-        for event in events:
-            # Add realistic time delays between events
-            delay = random.uniform(0.5, 3.5)
-            current_time += datetime.timedelta(seconds=delay)
+        for idx, event in enumerate(events):
+            needs_amount, needs_balance, is_update, is_debit = event_flags[event]
+            # Round the raw draws once; strings are only built for fields that are kept
+            amount = round(amounts[idx], 2) if needs_amount else None
+            balance_before = round(balances[idx], 2) if needs_balance else None
             
             log_entry = {
-                "timestamp": self.generate_timestamp(current_time),
+                "timestamp": timestamps[idx],
                 "transaction_id": trans_id,
                 "transaction_type": trans_type,
                 "event": event,
@@ -140,45 +236,71 @@ class BankingLogGenerator:
                 "branch_id": branch,
                 "customer_id": customer_id,
                 "account_number": account_num,
-                "severity": severity if event in ["SESSION_START", "TELLER_LOGIN", 
-                                                   "CUSTOMER_VERIFY"] else "INFO",
-                "status": "SUCCESS" if random.random() > 0.02 else "WARNING",
-                "amount": f"{random.uniform(10.00, 50000.00):.2f}" if "AMOUNT" in event or 
-                         "DEPOSIT" in event or "WITHDRAWAL" in event else None,
-                "balance_before": f"{random.uniform(100.00, 100000.00):.2f}" if 
-                                 "BALANCE" in event else None,
+                "severity": severity if event in auth_events else "INFO",
+                "status": "SUCCESS" if status_draws[idx] > 0.02 else "WARNING",
+                "amount": f"{amount:.2f}" if needs_amount else None,
+                "balance_before": f"{balance_before:.2f}" if needs_balance else None,
                 "balance_after": None,
                 "metadata": {
-                    "terminal_id": f"TERM_{random.randint(1, 50):03d}",
-                    "session_id": f"SES_{random.randint(100000, 999999)}",
-                    "ip_address": f"10.{random.randint(0,255)}.{random.randint(0,255)}.{random.randint(1,254)}"
+                    "terminal_id": f"TERM_{terminals[idx]:03d}",
+                    "session_id": f"SES_{sessions[idx]}",
+                    "ip_address": f"10.{octets_a[idx]}.{octets_b[idx]}.{hosts[idx]}"
                 }
             }
             
             # Calculate balance_after for balance updates
-            if log_entry["balance_before"] and "UPDATE" in event:
-                if log_entry["amount"]:
-                    before = float(log_entry["balance_before"])
-                    amount = float(log_entry["amount"])
-                    if "DEBIT" in event or "WITHDRAWAL" in event:
-                        log_entry["balance_after"] = f"{before - amount:.2f}"
-                    else:
-                        log_entry["balance_after"] = f"{before + amount:.2f}"
+            if needs_balance and needs_amount and is_update:
+                if is_debit:
+                    log_entry["balance_after"] = f"{balance_before - amount:.2f}"
+                else:
+                    log_entry["balance_after"] = f"{balance_before + amount:.2f}"
             
             logs.append(log_entry)
         
         return logs
     
     def generate_dataset(self, num_transactions: int = 1000, 
-                        anomaly_rate: float = 0.05) -> List[Dict]:
-        """Generate complete dataset of banking logs"""
+                        anomaly_rate: float = 0.05,
+                        max_workers: int = 1) -> List[Dict]:
+        """Generate complete dataset of banking logs
+        
+        With ``max_workers > 1`` the transaction range is split into shards that
+        are generated in separate processes, each with its own spawned seed.
+        """
+        if max_workers <= 1 or num_transactions < 2:
+            return self._generate_range(0, num_transactions, anomaly_rate)
+        
+        num_shards = min(max_workers, num_transactions)
+        bounds = np.linspace(0, num_transactions, num_shards + 1, dtype=int).tolist()
+        seeds = np.random.SeedSequence(int(self.rng.integers(2**63))).spawn(num_shards)
+        
+        all_logs = []
+        with ProcessPoolExecutor(max_workers=num_shards) as executor:
+            futures = [
+                executor.submit(_generate_chunk, bounds[i], bounds[i + 1], anomaly_rate, seeds[i])
+                for i in range(num_shards)
+            ]
+            # Concatenate in submission order so transaction ids stay sorted
+            for future in futures:
+                all_logs.extend(future.result())
+        return all_logs
+    
+    def _generate_range(self, start: int, stop: int, 
+                        anomaly_rate: float) -> List[Dict]:
+        """Generate logs for transactions ``start`` (inclusive) to ``stop`` (exclusive)"""
         all_logs = []
         base_date = datetime.datetime(2024, 1, 1, 9, 0, 0)
+        count = stop - start
+        
+        # Per-transaction draws for the whole range
+        spacing = self.rng.uniform(5, 15, count).tolist()
+        type_indices = self.rng.integers(0, len(self.transaction_types), count).tolist()
+        anomaly_flags = (self.rng.random(count) < anomaly_rate).tolist()
         
-        for i in range(num_transactions):
+        for offset, i in enumerate(range(start, stop)):
             # Vary time throughout business days
             day_offset = i // 50  # ~50 transactions per day
-            time_offset = (i % 50) * random.uniform(5, 15)  # Minutes between transactions
+            time_offset = (i % 50) * spacing[offset]  # Minutes between transactions
             
             trans_time = base_date + datetime.timedelta(days=day_offset, minutes=time_offset)
             
@@ -186,10 +308,10 @@ class BankingLogGenerator:
             if trans_time.weekday() >= 5:
                 trans_time += datetime.timedelta(days=2)
             
-            trans_type = random.choice(self.transaction_types)
+            trans_type = self.transaction_types[type_indices[offset]]
             trans_id = f"TXN_{trans_time.strftime('%Y%m%d')}_{i:06d}"
             
-            is_anomaly = random.random() < anomaly_rate
+            is_anomaly = anomaly_flags[offset]
             
             transaction_logs = self.generate_transaction_log(
                 trans_type, trans_id, trans_time, is_anomaly
@@ -199,10 +321,21 @@ class BankingLogGenerator:
         
         return all_logs
     
-    def export_logs(self, logs: List[Dict], filename: str = "banking_teller_logs.json"):
-        """Export logs to JSON file"""
-        with open(filename, 'w') as f:
-            json.dump(logs, f, indent=2)
+    def export_logs(self, logs: List[Dict], filename: str = "banking_teller_logs.json",
+                    fmt: str = "json"):
+        """Export logs to JSON file (an indented array, or one object per line if ``fmt`` is "jsonl")"""
+        if fmt == "json":
+            with open(filename, 'w') as f:
+                json.dump(logs, f, indent=2)
+        elif fmt == "jsonl":
+            # Stream one compact object per line through a 1 MiB buffer, reusing one encoder
+            encode = json.JSONEncoder(separators=(',', ':')).encode
+            with open(filename, 'w', buffering=1 << 20) as f:
+                for entry in logs:
+                    f.write(encode(entry))
+                    f.write('\n')
+        else:
+            raise ValueError(f"Unsupported export format: {fmt}")
         print(f"Generated {len(logs)} log entries across multiple transactions")
         print(f"Exported to {filename}")
     
@@ -213,40 +346,50 @@ class BankingLogGenerator:
         if not logs:
             return
         
-        # First pass: collect all possible fieldnames including flattened metadata
-        all_fieldnames = set()
-        flattened_logs = []
-        for log in logs:
-            log_copy = log.copy()
-            if 'metadata' in log_copy:
-                for k, v in log_copy['metadata'].items():
-                    log_copy[f'metadata_{k}'] = v
-                    all_fieldnames.add(f'metadata_{k}')
-                del log_copy['metadata']
-            all_fieldnames.update(log_copy.keys())
-            flattened_logs.append(log_copy)
+        # Every generated entry shares one schema, so the columns come from the first
+        # entry (metadata fields flattened and placed at the end, each group sorted)
+        first = logs[0]
+        base_keys = sorted(k for k in first if k != 'metadata')
+        metadata_keys = sorted(first.get('metadata', {}))
+        fieldnames = base_keys + [f'metadata_{k}' for k in metadata_keys]
+        
+        # Positional rows in header order; csv.writer emits None as an empty field
+        base_row = operator.itemgetter(*base_keys)
         
-        # Sort fieldnames for consistent column order (metadata fields at end)
-        fieldnames = sorted([f for f in all_fieldnames if not f.startswith('metadata_')])
-        fieldnames.extend(sorted([f for f in all_fieldnames if f.startswith('metadata_')]))
+        def rows():
+            for log in logs:
+                metadata = log.get('metadata', {})
+                yield (*base_row(log), *[metadata.get(k) for k in metadata_keys])
         
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(flattened_logs)
+        with open(filename, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows())
         
         print(f"Exported to {filename}")
 
 
+def _generate_chunk(start: int, stop: int, anomaly_rate: float,
+                    seed: np.random.SeedSequence) -> List[Dict]:
+    """Worker entry point: generate one shard of transactions with its own RNG"""
+    return BankingLogGenerator(seed)._generate_range(start, stop, anomaly_rate)
+
+
 # Generate the dataset
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic banking teller logs")
+    parser.add_argument("--format", choices=("json", "jsonl"), default="json",
+                        help="json writes an indented array; jsonl writes one object per line")
+    args = parser.parse_args()
+    
     generator = BankingLogGenerator()
     
     # Generate 1500 transactions with 5% anomaly rate
-    logs = generator.generate_dataset(num_transactions=1500, anomaly_rate=0.05)
+    logs = generator.generate_dataset(num_transactions=1500, anomaly_rate=0.05,
+                                      max_workers=os.cpu_count() or 1)
     
     # Export in both formats
-    generator.export_logs(logs, "banking_teller_logs.json")
+    generator.export_logs(logs, f"banking_teller_logs.{args.format}", fmt=args.format)
     generator.export_csv(logs, "banking_teller_logs.csv")
     
     # Print statistics
@@ -0,0 +1,226 @@
+"""
+Column-oriented projection of sanitized records shared by the compliance and fraud engines.
+
+Both engines inspect the same handful of fields on every record. `to_soa` walks
+the records once and returns NumPy columns (plus the few string columns regex
+checks still need) so each engine reduces to boolean masks over arrays.
+"""
+from __future__ import annotations
+
+import functools
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from itertools import chain
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:  # Optional C ISO-8601 parser
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - optional dependency
+    _parse_iso = None
+
+
+_MICROSECOND = timedelta(microseconds=1)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class EventLabel(IntEnum):
+    """Integer codes for the event labels the engines branch on."""
+
+    OTHER = 0
+    TRANSACTION = 1
+    GENERIC = 2
+    LOGIN = 3
+
+
+_LABEL_CODES: Dict[object, EventLabel] = {
+    "transaction_event": EventLabel.TRANSACTION,
+    "generic_event": EventLabel.GENERIC,
+    "login_event": EventLabel.LOGIN,
+}
+
+RecordColumns = Dict[str, Any]
+
+
+def _extract_timestamp(record: Dict[str, object]) -> datetime | None:
+    timestamp = record.get("timestamp")
+    if not isinstance(timestamp, str):
+        return None
+    return _parse_timestamp(timestamp)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_timestamp(timestamp: str) -> datetime | None:
+    # Log batches repeat timestamps heavily, so parses are memoised per raw string.
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1]
+    if _parse_iso is not None:
+        try:
+            return _parse_iso(timestamp)
+        except ValueError:
+            pass  # ciso8601 is stricter about some forms fromisoformat accepts
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+
+
+def _epoch_microseconds(timestamp: datetime) -> int:
+    """Integer microseconds since the epoch; naive values stay on wall-clock time."""
+    epoch = _NAIVE_EPOCH if timestamp.tzinfo is None else _AWARE_EPOCH
+    return (timestamp - epoch) // _MICROSECOND
+
+
+def record_epoch_us(record: Dict[str, object]) -> int | None:
+    """Epoch microseconds of a record's ``timestamp`` string, or None when absent or unparseable."""
+    timestamp = _extract_timestamp(record)
+    return _epoch_microseconds(timestamp) if timestamp is not None else None
+
+
+def _sum_amounts(values: List[str], rows: List[int], row_count: int) -> np.ndarray:
+    """
+    Per-row totals of monetary strings, parsed in one vectorised pass.
+
+    Plain ``digits[.digits]`` values (after dropping commas) go through a single
+    NumPy conversion; anything else falls back to ``float`` so accepted inputs
+    match the previous per-value parse.
+    """
+    totals = np.zeros(row_count, dtype=np.float64)
+    if not values:
+        return totals
+    row_index = np.asarray(rows, dtype=np.int64)
+    cleaned = np.char.replace(np.asarray(values, dtype=np.str_), ",", "")
+    plain = np.char.isdigit(np.char.replace(cleaned, ".", "", 1))
+    try:
+        converted = cleaned[plain].astype(np.float64)
+    except ValueError:  # e.g. superscript digits pass isdigit but not conversion
+        plain[:] = False
+    else:
+        totals += np.bincount(row_index[plain], weights=converted, minlength=row_count)
+    for position in np.flatnonzero(~plain).tolist():
+        try:
+            totals[row_index[position]] += float(values[position].replace(",", ""))
+        except ValueError:
+            continue
+    return totals
+
+
+def _extract_accounts(parsed: Dict[str, object], hashed_fields: Dict[str, str]) -> List[str]:
+    tokens = parsed.get("account_tokens", ()) if isinstance(parsed, dict) else ()
+    hashed_values = (str(value) for value in hashed_fields.values()) if hashed_fields else ()
+    # Order-preserving dedup without mutating the caller's parsed record
+    return list(dict.fromkeys(token for token in chain(tokens, hashed_values) if token))
+
+
+def _content_string(record: Dict[str, object]) -> str:
+    # Every string value (message included) joined once for content checks
+    content = " ".join(value for value in record.values() if isinstance(value, str))
+    raw_message = record.get("message")
+    if raw_message is not None and not isinstance(raw_message, str):
+        content = f"{raw_message} {content}"
+    return content
+
+
+def to_soa(
+    records: Sequence[Dict[str, object]],
+    parsed_records: Optional[Sequence[Dict[str, object]]] = None,
+    epoch_us: Optional[Sequence[Optional[int]]] = None,
+) -> RecordColumns:
+    """
+    Project dict records into parallel columns, one row per dict record.
+
+    Row columns: ``index`` (position in ``records``), ``label_id``, ``has_timestamp``,
+    ``has_hashed``, ``content``; with ``parsed_records`` also ``has_parsed``,
+    ``ts_valid``, ``ts_us``, ``amount`` and ``login_failed``. Account-level columns
+    are exploded: ``account_rows``/``account_keys`` and ``login_rows``/``login_keys``.
+    Records without a parsed counterpart (past the end of ``parsed_records``) have
+    ``has_parsed`` false and contribute no account rows, matching ``zip`` semantics.
+    ``epoch_us``, aligned with ``records``, supplies ``record_epoch_us`` values
+    computed earlier so timestamps are not parsed again.
+    """
+    parsed_count = len(parsed_records) if parsed_records is not None else 0
+    # One tuple per record: (index, label_id, has_timestamp, has_hashed, content,
+    # has_parsed, ts_valid, ts_us, login_failed), transposed into columns at the end
+    rows: List[tuple] = []
+    amount_values: List[str] = []
+    amount_rows: List[int] = []
+    account_rows: List[int] = []
+    account_keys: List[str] = []
+    login_rows: List[int] = []
+    login_keys: List[object] = []
+    # Bound methods hoisted out of the per-record loop
+    append_row = rows.append
+    append_amount = amount_values.append
+    append_amount_row = amount_rows.append
+    label_code = _LABEL_CODES.get
+    other_label = EventLabel.OTHER
+    login_label = EventLabel.LOGIN
+
+    for position, record in enumerate(records):
+        if not isinstance(record, dict):
+            continue
+        row = len(rows)
+        label_id = label_code(record.get("analysis", {}).get("event_label"), other_label)
+        hashed_fields = record.get("hashed_fields") or {}
+        has_timestamp = bool(record.get("timestamp"))
+        content = _content_string(record)
+
+        if position >= parsed_count:
+            append_row((position, label_id, has_timestamp, bool(hashed_fields), content, False, False, 0, False))
+            continue
+        parsed = parsed_records[position]
+        record_us = epoch_us[position] if epoch_us is not None else record_epoch_us(record)
+        for value in parsed.get("monetary_values", []):
+            if isinstance(value, str):
+                append_amount(value)
+                append_amount_row(row)
+        accounts = _extract_accounts(parsed, hashed_fields)
+        if accounts:
+            account_rows.extend([row] * len(accounts))
+            account_keys.extend(accounts)
+
+        failed = False
+        if label_id == login_label:
+            message = str(record.get("message", "")).lower()
+            failed = "failed" in message or "denied" in message
+            if failed:
+                failed_accounts = accounts or list(hashed_fields.values())
+                login_rows.extend([row] * len(failed_accounts))
+                login_keys.extend(failed_accounts)
+        append_row(
+            (
+                position,
+                label_id,
+                has_timestamp,
+                bool(hashed_fields),
+                content,
+                True,
+                record_us is not None,
+                record_us if record_us is not None else 0,
+                failed,
+            )
+        )
+
+    row_count = len(rows)
+    if rows:
+        index, label_ids, has_timestamp, has_hashed, content, has_parsed, ts_valid, ts_us, login_failed = zip(*rows)
+    else:
+        index = label_ids = has_timestamp = has_hashed = content = has_parsed = ts_valid = ts_us = login_failed = ()
+    return {
+        "index": np.asarray(index, dtype=np.int64),
+        "label_id": np.asarray(label_ids, dtype=np.int8),
+        "has_timestamp": np.asarray(has_timestamp, dtype=np.bool_),
+        "has_hashed": np.asarray(has_hashed, dtype=np.bool_),
+        "content": list(content),
+        "has_parsed": np.asarray(has_parsed, dtype=np.bool_),
+        "ts_valid": np.asarray(ts_valid, dtype=np.bool_),
+        "ts_us": np.asarray(ts_us, dtype=np.int64),
+        "amount": _sum_amounts(amount_values, amount_rows, row_count),
+        "login_failed": np.asarray(login_failed, dtype=np.bool_),
+        "account_rows": np.asarray(account_rows, dtype=np.int32),
+        "account_keys": account_keys,
+        "login_rows": np.asarray(login_rows, dtype=np.int32),
+        "login_keys": login_keys,
+    }
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from statistics import mean
 from typing import Dict, List, Optional
 
 import numpy as np
@@ -14,12 +13,29 @@ from sklearn.ensemble import IsolationForest
 LOGGER = logging.getLogger(__name__)
 
 
+def top_k_descending(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the ``k`` largest values, highest first; ties go to the lower index.
+
+    A partition finds the k-th largest value in O(n). Every element tied with it is
+    kept as a candidate, so which tied indices make the cut never depends on the
+    partition's internal order.
+    """
+    kth = np.partition(values, values.size - k)[values.size - k]
+    candidates = np.flatnonzero(values >= kth)
+    order = np.lexsort((candidates, -values[candidates]))
+    return candidates[order[:k]]
+
+
 @dataclass(slots=True)
 class AnomalyDetectorConfig:
     contamination: float = 0.05
     random_state: int = 42
     min_samples: int = 20
     score_normalization: bool = True
+    n_estimators: int = 100
+    max_samples: int = 256  # per-tree subsample, capped at the number of samples
+    n_jobs: int | None = -1  # fit/score trees on all cores
 
 
 @dataclass(slots=True)
@@ -43,7 +59,20 @@ class AnomalyDetector:
     config: AnomalyDetectorConfig = field(default_factory=AnomalyDetectorConfig)
     _model: IsolationForest | None = field(default=None, init=False, repr=False)
 
-    def score_embeddings(self, embeddings: Optional[np.ndarray]) -> AnomalySummary:
+    def fit(self, embeddings: np.ndarray) -> IsolationForest:
+        """Fit a fresh Isolation Forest on embeddings and keep it for later scoring."""
+        self._model = IsolationForest(
+            n_estimators=self.config.n_estimators,
+            max_samples=min(self.config.max_samples, embeddings.shape[0]),
+            contamination=self.config.contamination,
+            random_state=self.config.random_state,
+            n_jobs=self.config.n_jobs,
+        )
+        self._model.fit(embeddings)
+        return self._model
+
+    def score_embeddings(self, embeddings: Optional[np.ndarray], reuse_model: bool = False) -> AnomalySummary:
+        """Fit on and score embeddings; ``reuse_model`` scores with the model from a prior ``fit``."""
         if embeddings is None or embeddings.size == 0:
             LOGGER.info("Skipping anomaly detection: no embeddings available.")
             return AnomalySummary(scores=[], threshold=0.0, top_indices=[])
@@ -65,38 +94,37 @@ class AnomalyDetector:
                 metadata={"sample_count": float(num_samples)},
             )
 
-        self._model = IsolationForest(
-            contamination=self.config.contamination,
-            random_state=self.config.random_state,
-        )
-        self._model.fit(embeddings)
+        if not reuse_model or self._model is None:
+            self.fit(embeddings)
 
         raw_scores = -self._model.score_samples(embeddings)
         if self.config.score_normalization:
             normalized_scores = self._normalize_scores(raw_scores)
         else:
-            normalized_scores = raw_scores.tolist()
+            normalized_scores = raw_scores
 
-        threshold = float(np.quantile(normalized_scores, 1 - self.config.contamination))
-        top_indices = np.argsort(normalized_scores)[::-1][:max(1, int(num_samples * self.config.contamination))]
+        # Order statistic at the (1 - contamination) rank: O(n) partition, no interpolation
+        threshold_rank = min(num_samples - 1, int(num_samples * (1 - self.config.contamination)))
+        threshold = float(np.partition(normalized_scores, threshold_rank)[threshold_rank])
+        top_k = min(num_samples, max(1, int(num_samples * self.config.contamination)))
+        top_indices = top_k_descending(normalized_scores, top_k)
         metadata = {
-            "mean_score": float(mean(normalized_scores)),
-            "max_score": float(max(normalized_scores)),
-            "min_score": float(min(normalized_scores)),
+            "mean_score": float(normalized_scores.mean()),
+            "max_score": float(normalized_scores.max()),
+            "min_score": float(normalized_scores.min()),
         }
 
         return AnomalySummary(
-            scores=normalized_scores,
+            scores=normalized_scores.tolist(),
             threshold=threshold,
             top_indices=top_indices.tolist(),
             metadata=metadata,
         )
 
-    def _normalize_scores(self, scores: np.ndarray) -> List[float]:
+    def _normalize_scores(self, scores: np.ndarray) -> np.ndarray:
         min_score = float(np.min(scores))
         max_score = float(np.max(scores))
         if max_score - min_score < 1e-9:
-            return [0.0 for _ in scores]
-        normalized = (scores - min_score) / (max_score - min_score)
-        return normalized.tolist()
+            return np.zeros_like(scores, dtype=np.float64)
+        return (scores - min_score) / (max_score - min_score)
 
@@ -6,44 +6,130 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import csv
 from itertools import chain
-from typing import Iterable, List, Any
+from typing import IO, Iterable, List, Any
 
 from .config import Settings
 from .ci import generate_summary, write_summary
+from .connectors.base import batched
 from .ingestion import load_connectors_from_path
 from .log_format import LogFormatConfig
 from .pipeline import LogMinerPipeline
 
+try:  # Optional fast JSON encoder with native NumPy support
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # Optional vectorized CSV reader
+    import pyarrow as _pa
+    import pyarrow.csv as _pacsv
+except ImportError:  # pragma: no cover - optional dependency
+    _pa = _pacsv = None
+
 LOGGER = logging.getLogger("logminer_qa.cli")
 
+# Large write buffer so per-record writes coalesce into few syscalls
+OUTPUT_BUFFER_SIZE = 2 << 20
+# Records serialized per hand-off to the writer thread, and hand-offs allowed in flight
+WRITE_BATCH_SIZE = 256
+WRITE_QUEUE_SIZE = 1024
+
 
-def _convert_numpy_types(obj: Any) -> Any:
-    """Convert NumPy types to native Python types for JSON serialization."""
+def _numpy_default(obj: Any) -> Any:
+    """``json`` default hook converting NumPy scalars/arrays the encoder cannot handle."""
     try:
         import numpy as np
     except ImportError:
-        # NumPy not available, return as-is
-        return obj
-    
-    # Handle NumPy integer types
-    if isinstance(obj, (np.integer, np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64)):
-        return int(obj)
-    # Handle NumPy float types
-    if isinstance(obj, (np.floating, np.float16, np.float32, np.float64)):
-        return float(obj)
-    # Handle NumPy bool
-    if isinstance(obj, np.bool_):
-        return bool(obj)
-    if isinstance(obj, np.ndarray):
-        return obj.tolist()
-    if isinstance(obj, dict):
-        return {key: _convert_numpy_types(value) for key, value in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_convert_numpy_types(item) for item in obj]
-    return obj
+        np = None
+    if np is not None:
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.bool_):
+            return bool(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _drain_to_handle(pending: "queue.Queue[Any]", handle: IO[Any]) -> None:
+    while True:
+        chunk = pending.get()
+        if chunk is None:
+            return
+        handle.write(chunk)
+
+
+def _enqueue(pending: "queue.Queue[Any]", item: Any, writer: Future) -> bool:
+    """Put item on the queue unless the writer has stopped; returns False in that case."""
+    while not writer.done():
+        try:
+            pending.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _write_in_background(chunks: Iterable[Any], handle: IO[Any]) -> None:
+    """
+    Produce chunks on the calling thread while a writer thread flushes them to handle,
+    so serialization (CPU) overlaps with disk writes (IO).
+    """
+    pending: "queue.Queue[Any]" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="logminer-writer") as executor:
+        writer = executor.submit(_drain_to_handle, pending, handle)
+        try:
+            for chunk in chunks:
+                if not _enqueue(pending, chunk, writer):
+                    break
+        finally:
+            _enqueue(pending, None, writer)
+        # Re-raise any error from the writer thread
+        writer.result()
+
+
+def _write_sanitized_logs(records: Iterable[Any], destination: Path) -> None:
+    """Write records as newline-delimited JSON, preferring orjson when installed."""
+    if orjson is not None:
+        # orjson serializes NumPy scalars/arrays itself, so no pre-conversion pass is needed
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        with destination.open("wb", buffering=OUTPUT_BUFFER_SIZE) as handle:
+            _write_in_background(
+                (
+                    b"".join([orjson.dumps(record, option=options) for record in batch])
+                    for batch in batched(records, WRITE_BATCH_SIZE)
+                ),
+                handle,
+            )
+        return
+    # One compact encoder for the whole file; json.dumps would build a new one per call
+    encode = json.JSONEncoder(separators=(",", ":"), default=_numpy_default).encode
+    with destination.open("w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as handle:
+        _write_in_background(
+            (
+                "".join([encode(record) + "\n" for record in batch])
+                for batch in batched(records, WRITE_BATCH_SIZE)
+            ),
+            handle,
+        )
+
+
+def _write_report(payload: Any, destination: Path) -> None:
+    """Write the analysis report as indented JSON, preferring orjson when installed."""
+    if orjson is not None:
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        with destination.open("wb") as handle:
+            handle.write(orjson.dumps(payload, option=options))
+        return
+    with destination.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, default=_numpy_default)
 
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
@@ -146,6 +232,10 @@ def _load_json_lines(path: Path) -> Iterable[object]:
 
 
 def _load_csv(path: Path) -> Iterable[object]:
+    header = _read_csv_header(path)
+    if header and _pacsv is not None and len(set(header)) == len(header):
+        yield from _load_csv_arrow(path, header)
+        return
     with path.open("r", encoding="utf-8") as handle:
         reader = csv.DictReader(handle)
         if not reader.fieldnames:
@@ -157,6 +247,39 @@ def _load_csv(path: Path) -> Iterable[object]:
             yield cleaned
 
 
+def _read_csv_header(path: Path) -> List[str]:
+    """Return the header row with blank names replaced by positional column names."""
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        first_row = next(csv.reader(handle), None)
+    if not first_row:
+        return []
+    return [name or f"column_{idx}" for idx, name in enumerate(first_row)]
+
+
+def _load_csv_arrow(path: Path, header: List[str]) -> Iterable[object]:
+    """Stream CSV rows via pyarrow's batched C++ reader, keeping every value a string."""
+    def _skip_invalid(row: Any) -> str:
+        LOGGER.warning("Skipping malformed CSV row %s in %s: %s", row.number, path, row.text)
+        return "skip"
+
+    read_options = _pacsv.ReadOptions(column_names=header, skip_rows=1)
+    parse_options = _pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=_skip_invalid)
+    # Match csv.DictReader: no type inference and empty strings instead of nulls
+    convert_options = _pacsv.ConvertOptions(
+        column_types={name: _pa.string() for name in header},
+        strings_can_be_null=False,
+        quoted_strings_can_be_null=False,
+    )
+    with _pacsv.open_csv(
+        str(path),
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    ) as reader:
+        for batch in reader:
+            yield from batch.to_pylist()
+
+
 def _load_plain_text(path: Path) -> Iterable[object]:
     with path.open("r", encoding="utf-8") as handle:
         for line in handle:
@@ -202,11 +325,7 @@ def main(argv: Iterable[str] | None = None) -> int:
 
     if args.output:
         LOGGER.info("Writing sanitized logs to %s", args.output)
-        with args.output.open("w", encoding="utf-8") as handle:
-            for record in artifact.sanitized_logs:
-                cleaned = _convert_numpy_types(record)
-                handle.write(json.dumps(cleaned))
-                handle.write("\n")
+        _write_sanitized_logs(artifact.sanitized_logs, args.output)
 
     if args.report:
         LOGGER.info("Writing frequency and clustering report to %s", args.report)
@@ -218,9 +337,7 @@ def main(argv: Iterable[str] | None = None) -> int:
             "compliance_findings": artifact.compliance_findings,
             "fraud_findings": artifact.fraud_findings,
         }
-        cleaned_payload = _convert_numpy_types(report_payload)
-        with args.report.open("w", encoding="utf-8") as handle:
-            json.dump(cleaned_payload, handle, indent=2)
+        _write_report(report_payload, args.report)
 
     if args.tests:
         LOGGER.info("Writing generated test cases to %s", args.tests)
@@ -232,7 +349,7 @@ def main(argv: Iterable[str] | None = None) -> int:
         summary = generate_summary(artifact)
         write_summary(summary, args.ci_summary)
 
-    LOGGER.info("Processed %d log records", len(artifact.sanitized_logs))
+    LOGGER.info("Processed %d log records", artifact.total_records)
     return 0
 
 
@@ -7,9 +7,12 @@ import logging
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Tuple
 
+import numpy as np
 from sklearn.cluster import MiniBatchKMeans
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+from .anomaly import top_k_descending
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -40,6 +43,7 @@ class EventClusterer:
     random_state: int = 42
 
     vectorizer: TfidfVectorizer = field(init=False)
+    _feature_names: np.ndarray | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.vectorizer = TfidfVectorizer(
@@ -59,6 +63,8 @@ class EventClusterer:
             return ClusterSummary(labels=[-1] * len(corpus))
 
         matrix = self.vectorizer.fit_transform(corpus)
+        # Vocabulary is fixed until the next fit; build the name array once
+        self._feature_names = np.asarray(self.vectorizer.get_feature_names_out())
         clusters = min(self.num_clusters, len(corpus))
         model = MiniBatchKMeans(
             n_clusters=clusters,
@@ -71,10 +77,11 @@ class EventClusterer:
         return ClusterSummary(labels=list(labels), top_terms=top_terms)
 
     def _extract_top_terms(self, model: MiniBatchKMeans, top_n: int = 5) -> Dict[str, List[str]]:
-        terms = self.vectorizer.get_feature_names_out()
-        top_terms: Dict[str, List[str]] = {}
-        for idx, center in enumerate(model.cluster_centers_):
-            top_indices = center.argsort()[::-1][:top_n]
-            top_terms[str(idx)] = [terms[index] for index in top_indices]
-        return top_terms
-
+        terms = self._feature_names
+        if terms is None:
+            terms = self._feature_names = np.asarray(self.vectorizer.get_feature_names_out())
+        top_n = min(top_n, len(terms))
+        return {
+            str(idx): terms[top_k_descending(center, top_n)].tolist()
+            for idx, center in enumerate(model.cluster_centers_)
+        }
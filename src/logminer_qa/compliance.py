@@ -4,13 +4,36 @@ Banking compliance and fraud-specific analysis utilities.
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
+from itertools import accumulate
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, Iterable, List, Sequence
+from datetime import timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ._records import EventLabel, RecordColumns, to_soa
+
+try:  # Optional SIMD multi-record regex scanning
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
+try:  # Optional JIT for the velocity scan
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
 
 
 ACCOUNT_PATTERN = re.compile(r"\b\d{12,18}\b")
+# Any ACCOUNT_PATTERN hit contains 12 consecutive digits; this cheaper scan rejects most lines first.
+_DIGIT_RUN_PREFILTER = re.compile(r"\d{12}")
+# Non-word separator so \b boundaries never join digits across records in a batched scan
+_SCAN_SEPARATOR = b"\n"
+DATA_ACCESS_PATTERN = re.compile(r"data access", re.IGNORECASE)
 VELOCITY_WINDOW = timedelta(minutes=10)
+VELOCITY_EVENT_SPAN = 3
+_VELOCITY_WINDOW_US = VELOCITY_WINDOW // timedelta(microseconds=1)
 
 
 @dataclass(slots=True)
@@ -47,16 +70,87 @@ class FraudFinding:
         }
 
 
-def _extract_timestamp(record: Dict[str, object]) -> datetime | None:
-    timestamp = record.get("timestamp")
-    if not isinstance(timestamp, str):
-        return None
-    try:
-        if timestamp.endswith("Z"):
-            timestamp = timestamp[:-1]
-        return datetime.fromisoformat(timestamp)
-    except ValueError:
+def _compile_account_database():
+    if hyperscan is None:
         return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[ACCOUNT_PATTERN.pattern.encode("ascii")],
+        ids=[0],
+        elements=1,
+        flags=[0],
+    )
+    return database
+
+
+_ACCOUNT_DATABASE = _compile_account_database()
+
+
+def _count_account_matches(messages: Sequence[str]) -> int:
+    """Number of messages containing an ACCOUNT_PATTERN match."""
+    prefilter = _DIGIT_RUN_PREFILTER.search
+    account_search = ACCOUNT_PATTERN.search
+    if _ACCOUNT_DATABASE is None:
+        return sum(1 for message in messages if prefilter(message) and account_search(message))
+    # Hyperscan's \b and \d are ASCII-only, so non-ASCII messages keep the Unicode-aware re path.
+    ascii_chunks: List[bytes] = []
+    append_chunk = ascii_chunks.append
+    count = 0
+    for message in messages:
+        if message.isascii():
+            append_chunk(message.encode("ascii"))
+        elif prefilter(message) and account_search(message):
+            count += 1
+    if not ascii_chunks:
+        return count
+    # Exclusive end offset of each message within the joined blob
+    ends = list(accumulate(len(chunk) + len(_SCAN_SEPARATOR) for chunk in ascii_chunks))
+    matched: set[int] = set()
+
+    def on_match(_id: int, _start: int, end: int, _flags: int, _context: object) -> None:
+        matched.add(bisect_left(ends, end))
+
+    _ACCOUNT_DATABASE.scan(_SCAN_SEPARATOR.join(ascii_chunks), match_event_handler=on_match)
+    return count + len(matched)
+
+
+def _group_codes(keys: Sequence[object]) -> tuple[List[object], np.ndarray]:
+    """Dense integer codes for ``keys`` numbered in order of first appearance."""
+    index: Dict[object, int] = {}
+    codes = np.fromiter((index.setdefault(key, len(index)) for key in keys), dtype=np.int64, count=len(keys))
+    return list(index), codes
+
+
+def _velocity_scan(codes: np.ndarray, sorted_us: np.ndarray, window_us: int, flagged: np.ndarray) -> None:
+    # Rows are sorted by (code, timestamp); flag any group with SPAN+1 events inside the window.
+    for idx in range(sorted_us.shape[0] - VELOCITY_EVENT_SPAN):
+        group = codes[idx]
+        if (
+            not flagged[group]
+            and codes[idx + VELOCITY_EVENT_SPAN] == group
+            and sorted_us[idx + VELOCITY_EVENT_SPAN] - sorted_us[idx] <= window_us
+        ):
+            flagged[group] = True
+
+
+def _velocity_flags(codes: np.ndarray, timestamps_us: np.ndarray, group_count: int) -> np.ndarray:
+    flagged = np.zeros(group_count, dtype=np.bool_)
+    if timestamps_us.shape[0] <= VELOCITY_EVENT_SPAN:
+        return flagged
+    order = np.lexsort((timestamps_us, codes))
+    codes = codes[order]
+    timestamps_us = timestamps_us[order]
+    if njit is None:
+        same_group = codes[VELOCITY_EVENT_SPAN:] == codes[:-VELOCITY_EVENT_SPAN]
+        spans = timestamps_us[VELOCITY_EVENT_SPAN:] - timestamps_us[:-VELOCITY_EVENT_SPAN]
+        flagged[codes[:-VELOCITY_EVENT_SPAN][same_group & (spans <= _VELOCITY_WINDOW_US)]] = True
+    else:
+        _velocity_scan(codes, timestamps_us, _VELOCITY_WINDOW_US, flagged)
+    return flagged
+
+
+if njit is not None:
+    _velocity_scan = njit(cache=True)(_velocity_scan)
 
 
 class BankingComplianceEngine:
@@ -64,36 +158,36 @@ class BankingComplianceEngine:
     Performs lightweight compliance validations on sanitized banking logs.
     """
 
-    def evaluate(self, records: Sequence[Dict[str, object]]) -> List[ComplianceFinding]:
+    def evaluate(
+        self, records: Sequence[Dict[str, object]], columns: Optional[RecordColumns] = None
+    ) -> List[ComplianceFinding]:
+        """Run the checks over ``records``; pass ``columns`` from ``to_soa`` to reuse a projection."""
         findings: List[ComplianceFinding] = []
+        if columns is None:
+            columns = to_soa(records)
+        label_id = columns["label_id"]
+        has_hashed = columns["has_hashed"]
+        content = columns["content"]
+
+        missing_audit = (label_id == EventLabel.TRANSACTION) & ~(columns["has_timestamp"] & has_hashed)
         audit_failures: List[str] = []
-        pci_issues: List[str] = []
-        gdpr_gaps: List[str] = []
-
-        for record in records:
-            analysis = record.get("analysis", {}) if isinstance(record, dict) else {}
-            label = analysis.get("event_label")
-            hashed_fields = record.get("hashed_fields") if isinstance(record, dict) else {}
-            timestamp = record.get("timestamp") if isinstance(record, dict) else None
-            message = ""
-            if isinstance(record, dict):
-                message = str(record.get("message", ""))
-            if isinstance(record, dict):
-                for value in record.values():
-                    if isinstance(value, str):
-                        message += f" {value}"
-
-            if label == "transaction_event":
-                if not timestamp or not hashed_fields:
-                    audit_failures.append(
-                        f"Transaction record missing timestamp or hashed_fields: {record.get('journey_id') or record.get('session_id')}"
-                    )
-
-            if ACCOUNT_PATTERN.search(message):
-                pci_issues.append("Potential unmasked account number detected in sanitized payload.")
-
-            if label == "generic_event" and "data access" in message.lower() and not hashed_fields:
-                gdpr_gaps.append("Customer data access event missing hashed identifier.")
+        for position in columns["index"][missing_audit].tolist():
+            record = records[position]
+            audit_failures.append(
+                f"Transaction record missing timestamp or hashed_fields: {record.get('journey_id') or record.get('session_id')}"
+            )
+
+        # Account-number scan runs once over the batch (Hyperscan when installed)
+        pci_issues = ["Potential unmasked account number detected in sanitized payload."] * _count_account_matches(
+            content
+        )
+
+        gdpr_candidates = np.flatnonzero((label_id == EventLabel.GENERIC) & ~has_hashed)
+        gdpr_gaps = [
+            "Customer data access event missing hashed identifier."
+            for row in gdpr_candidates.tolist()
+            if DATA_ACCESS_PATTERN.search(content[row])
+        ]
 
         if audit_failures:
             findings.append(
@@ -147,39 +241,50 @@ class FraudDetectionEngine:
     Heuristic fraud pattern detection for sanitized logs.
     """
 
+    # HighValueTransfers keeps only the accounts with the largest peak amounts
+    HIGH_VALUE_TOP_K = 1000
+
     def evaluate(
-        self, records: Sequence[Dict[str, object]], parsed_records: Sequence[Dict[str, object]]
+        self,
+        records: Sequence[Dict[str, object]],
+        parsed_records: Sequence[Dict[str, object]],
+        columns: Optional[RecordColumns] = None,
     ) -> List[FraudFinding]:
+        """Detect fraud patterns; pass ``columns`` from ``to_soa(records, parsed_records)`` to reuse a projection."""
         findings: List[FraudFinding] = []
-        account_events: Dict[str, List[datetime]] = {}
-        high_value_accounts: Dict[str, float] = {}
-        login_failures: Dict[str, int] = {}
-
-        for record, parsed in zip(records, parsed_records):
-            if not isinstance(record, dict):
-                continue
-            hashed_fields = record.get("hashed_fields") or {}
-            analysis = record.get("analysis", {})
-            label = analysis.get("event_label")
-            timestamp = _extract_timestamp(record)
-            amount_values = self._parse_amounts(parsed)
-            accounts = self._extract_accounts(parsed, hashed_fields)
-            message = str(record.get("message", "")).lower()
-
-            for account in accounts:
-                if timestamp:
-                    account_events.setdefault(account, []).append(timestamp)
-                total_amount = sum(amount_values)
-                if total_amount > 5000:
-                    high_value_accounts[account] = max(high_value_accounts.get(account, 0.0), total_amount)
-
-            if label == "login_event" and ("failed" in message or "denied" in message):
-                for account in accounts or hashed_fields.values():
-                    login_failures[account] = login_failures.get(account, 0) + 1
-
-        velocity_accounts = [
-            account for account, events in account_events.items() if self._exceeds_velocity(events)
-        ]
+        if columns is None:
+            columns = to_soa(records, parsed_records)
+        # Account-level rows: one per (record, account) pair
+        account_rows = columns["account_rows"]
+        account_keys = columns["account_keys"]
+
+        timed = columns["ts_valid"][account_rows]
+        event_accounts = [key for key, keep in zip(account_keys, timed.tolist()) if keep]
+        event_times = columns["ts_us"][account_rows][timed]
+
+        amounts = columns["amount"][account_rows]
+        high_value = amounts > 5000
+        value_accounts = [key for key, keep in zip(account_keys, high_value.tolist()) if keep]
+        value_amounts = amounts[high_value]
+
+        failed_login_accounts = columns["login_keys"]
+
+        event_keys, event_codes = _group_codes(event_accounts)
+        flagged = _velocity_flags(event_codes, event_times, len(event_keys))
+        velocity_accounts = [account for account, hit in zip(event_keys, flagged.tolist()) if hit]
+
+        high_value_keys, value_codes = _group_codes(value_accounts)
+        peak_amounts = np.zeros(len(high_value_keys), dtype=np.float64)
+        np.maximum.at(peak_amounts, value_codes, value_amounts)
+        retained = self._top_k_codes(peak_amounts, self.HIGH_VALUE_TOP_K)
+        high_value_accounts: Dict[str, float] = {
+            high_value_keys[code]: amount for code, amount in zip(retained.tolist(), peak_amounts[retained].tolist())
+        }
+
+        login_keys, login_codes = _group_codes(failed_login_accounts)
+        login_counts = np.bincount(login_codes, minlength=len(login_keys))
+        login_failures: Dict[str, int] = dict(zip(login_keys, login_counts.tolist()))
+
         if velocity_accounts:
             findings.append(
                 FraudFinding(
@@ -233,27 +338,15 @@ class FraudDetectionEngine:
         return scenarios
 
     @staticmethod
-    def _parse_amounts(parsed: Dict[str, object]) -> List[float]:
-        results: List[float] = []
-        for value in parsed.get("monetary_values", []):
-            try:
-                results.append(float(value.replace(",", "")))
-            except (ValueError, AttributeError):
-                continue
-        return results
-
-    @staticmethod
-    def _extract_accounts(parsed: Dict[str, object], hashed_fields: Dict[str, str]) -> List[str]:
-        tokens = parsed.get("account_tokens", []) if isinstance(parsed, dict) else []
-        if hashed_fields:
-            tokens.extend(str(value) for value in hashed_fields.values())
-        return list({token for token in tokens if token})
+    def _top_k_codes(values: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k largest values (earliest first on ties), returned in ascending index order."""
+        if values.shape[0] <= k:
+            return np.arange(values.shape[0])
+        return np.sort(np.argsort(-values, kind="stable")[:k])
 
     @staticmethod
-    def _exceeds_velocity(events: Iterable[datetime]) -> bool:
-        ordered = sorted(timestamp for timestamp in events if timestamp)
-        for idx in range(len(ordered) - 3):
-            if ordered[idx + 3] - ordered[idx] <= VELOCITY_WINDOW:
-                return True
-        return False
+    def _exceeds_velocity(events: List[int]) -> bool:
+        timestamps_us = np.asarray(events, dtype=np.int64)
+        codes = np.zeros(timestamps_us.shape[0], dtype=np.int64)
+        return bool(_velocity_flags(codes, timestamps_us, 1)[0])
 
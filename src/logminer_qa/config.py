@@ -22,6 +22,8 @@ class SanitizerConfig:
     custom_entity_patterns: Optional[Path] = None
     token_prefix: str = "[TOKEN_"
     token_suffix: str = "]"
+    # Any hashlib name (secret-prefixed digest), or "blake2b-keyed" / "blake3" for keyed
+    # modes; changing it changes every hashed_fields value
     hash_algorithm: str = "sha256"
     hashing_secret_env: str = "LOGMINER_HASH_SECRET"
     referential_store_path: Optional[Path] = None
@@ -68,6 +70,7 @@ class Settings:
     chunk_size: int = 1000  # Process records in chunks for memory efficiency
     enable_streaming: bool = True  # Use streaming for large datasets
     validate_inputs: bool = True  # Validate input data before processing
+    process_workers: int = 1  # >1 sanitizes/parses chunks in that many worker processes
     # Log format: optional custom field names for timestamp / message / severity
     log_format: LogFormatConfig = field(default_factory=LogFormatConfig)
 
@@ -4,13 +4,43 @@ Base classes and helpers for log ingestion connectors.
 from __future__ import annotations
 
 import abc
+import queue
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, Iterable, Iterator, Mapping, MutableMapping, Optional
 
+try:  # Python 3.12+: batch boundaries handled in C
+    from itertools import batched as _itertools_batched
+except ImportError:  # pragma: no cover - older interpreters
+    _itertools_batched = None
+
 
 NormalizedRecord = Dict[str, Any]
 
+DEFAULT_TIMESTAMP_TTL_SECONDS = 1.0
+# (monotonic time checked, ISO timestamp) replaced as one tuple, so readers on
+# prefetch threads never pair a fresh check time with a stale value
+_default_now_cache = (float("-inf"), "")
+
+
+def _default_now() -> str:
+    """
+    Current UTC time in ISO format, re-read from the clock at most once per TTL.
+
+    Only used to stamp records that arrive without a timestamp, where
+    sub-second accuracy does not matter.
+    """
+    global _default_now_cache
+    checked_at, value = _default_now_cache
+    now = time.monotonic()
+    if now - checked_at >= DEFAULT_TIMESTAMP_TTL_SECONDS:
+        value = datetime.utcnow().isoformat()
+        _default_now_cache = (now, value)
+    return value
+
 
 @dataclass(slots=True)
 class ConnectorConfig:
@@ -32,6 +62,9 @@ class LogConnector(abc.ABC):
     structure data.
     """
 
+    # Network-bound connectors opt in so aggregate_logs fetches them on a background thread
+    prefetch: bool = False
+
     def __init__(self, config: ConnectorConfig) -> None:
         self.config = config
 
@@ -57,7 +90,7 @@ class LogConnector(abc.ABC):
         if timestamp:
             payload.setdefault("timestamp", timestamp)
         elif "timestamp" not in payload:
-            payload["timestamp"] = datetime.utcnow().isoformat()
+            payload["timestamp"] = _default_now()
         if metadata:
             payload.setdefault("metadata", {}).update(dict(metadata))
         payload.setdefault("source", self.config.name)
@@ -71,12 +104,74 @@ def batched(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
     """
     Yield lists of up to `size` elements from an arbitrary iterable.
     """
-    batch: list[Any] = []
-    for item in iterable:
-        batch.append(item)
-        if len(batch) >= size:
-            yield batch
-            batch = []
-    if batch:
+    if size < 1:
+        raise ValueError(f"Batch size must be at least 1, got {size}.")
+    if _itertools_batched is not None:
+        return map(list, _itertools_batched(iterable, size))
+    return _islice_batches(iter(iterable), size)
+
+
+def _islice_batches(iterator: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    while batch := list(islice(iterator, size)):
         yield batch
 
+
+class PrefetchIterator(Iterator[Any]):
+    """
+    Drain an iterable on a daemon thread, buffering up to `maxsize` items ahead of the consumer.
+
+    The producer starts on construction so several sources can be in flight at once.
+    Errors raised by the source are re-raised from `__next__`; `close()` stops the
+    producer, which closes the source, and waits up to `JOIN_TIMEOUT_SECONDS` for it.
+    """
+
+    _DONE = object()
+    JOIN_TIMEOUT_SECONDS = 5.0
+
+    def __init__(self, iterable: Iterable[Any], maxsize: int, name: str = "logminer-prefetch") -> None:
+        self._buffer: "queue.Queue[tuple[object, Any]]" = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(target=self._produce, args=(iterable,), name=name, daemon=True)
+        self._thread.start()
+
+    def _put(self, kind: object, value: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._buffer.put((kind, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, iterable: Iterable[Any]) -> None:
+        source = iter(iterable)
+        try:
+            for item in source:
+                if self._stop.is_set() or not self._put(None, item):
+                    return
+            self._put(self._DONE, None)
+        except BaseException as exc:  # surfaced on the consumer thread
+            self._put(exc, None)
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
+
+    def __next__(self) -> Any:
+        if self._finished:
+            raise StopIteration
+        kind, value = self._buffer.get()
+        if kind is None:
+            return value
+        self._finished = True
+        self._stop.set()
+        if kind is self._DONE:
+            raise StopIteration
+        raise kind
+
+    def close(self) -> None:
+        self._finished = True
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(self.JOIN_TIMEOUT_SECONDS)
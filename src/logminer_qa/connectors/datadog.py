@@ -25,9 +25,11 @@ class DatadogConnector(LogConnector):
     Optional:
         - region: e.g. "us3" (default "us")
         - timeframe: dict like {"from": "now-15m", "to": "now"}
-        - limit: integer (default 500)
+        - limit: page size, integer (default 500); all pages are followed
     """
 
+    prefetch = True
+
     DEFAULT_TIMEFRAME = {"from": "now-1h", "to": "now"}
 
     def fetch(self) -> Iterable[NormalizedRecord]:
@@ -57,25 +59,34 @@ class DatadogConnector(LogConnector):
 
         region = options.get("region", "us")
         base_url = f"https://api.{region}.datadoghq.com/api/v2/logs/events/search"
-        params = {
-            "page[limit]": int(options.get("limit", 500)),
-            "sort": "-timestamp",
-        }
-        headers = {
-            "DD-API-KEY": api_key,
-            "DD-APPLICATION-KEY": app_key,
-        }
+        # One pooled session per fetch so paginated requests reuse the TLS connection
+        session = requests.Session()
+        session.headers.update(
+            {
+                "DD-API-KEY": api_key,
+                "DD-APPLICATION-KEY": app_key,
+            }
+        )
+        timeframe = options.get("timeframe", self.DEFAULT_TIMEFRAME)
         body = {
             "filter": {
                 "query": query,
-                "from": options.get("timeframe", self.DEFAULT_TIMEFRAME).get("from"),
-                "to": options.get("timeframe", self.DEFAULT_TIMEFRAME).get("to"),
-            }
+                "from": timeframe.get("from"),
+                "to": timeframe.get("to"),
+            },
+            "page": {"limit": int(options.get("limit", 500))},
+            "sort": "-timestamp",
         }
         LOGGER.debug("Querying Datadog logs with query %s", query)
-        response = requests.post(base_url, headers=headers, params=params, json=body, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        for event in data.get("data", []):
-            yield event
-
+        try:
+            while True:
+                response = session.post(base_url, json=body, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+                yield from data.get("data", [])
+                cursor = (data.get("meta") or {}).get("page", {}).get("after")
+                if not cursor or not data.get("data"):
+                    break
+                body["page"]["cursor"] = cursor
+        finally:
+            session.close()
@@ -8,10 +8,17 @@ from typing import Iterable, Iterator, Mapping, MutableMapping
 
 import requests
 
-from .base import ConnectorConfig, LogConnector, NormalizedRecord, batched
+try:  # Optional incremental JSON parser for large pages
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from .base import ConnectorConfig, LogConnector, NormalizedRecord
 
 LOGGER = logging.getLogger(__name__)
 
+HITS_PREFIX = "hits.hits.item"
+
 
 class ElasticsearchConnector(LogConnector):
     """
@@ -22,34 +29,46 @@ class ElasticsearchConnector(LogConnector):
         - index:    Index name or pattern
         - query:    Optional Elasticsearch query DSL dict
         - page_size: Page size (default: 500)
+        - max_docs: Most documents to return (default: page_size); null scrolls every match
+        - scroll:   Scroll context keep-alive when paging past the first page (default: 1m)
         - auth:     Optional dict with 'username'/'password' or 'api_key'
         - verify_ssl: bool (default True)
     """
 
+    prefetch = True
+
     DEFAULT_QUERY: Mapping[str, object] = {
         "query": {"match_all": {}},
         "sort": [{"@timestamp": {"order": "desc"}}],
     }
 
     def fetch(self) -> Iterable[NormalizedRecord]:
-        for batch in self._scroll_batches():
-            for hit in batch:
-                source = hit.get("_source", {})
-                if not isinstance(source, MutableMapping):
-                    source = {"message": str(source)}
-                payload: MutableMapping[str, object] = dict(source)
-                timestamp = source.get("@timestamp") or source.get("timestamp")
-                message = source.get("message") or hit.get("_id")
-                yield self._normalize_common_fields(
-                    payload,
-                    event=source.get("event", "elk_event"),
-                    message=str(message) if message else None,
-                    timestamp=str(timestamp) if timestamp else None,
-                    metadata={"index": hit.get("_index"), "id": hit.get("_id")},
-                )
+        for hit in self._scroll_hits():
+            source = hit.get("_source", {})
+            if not isinstance(source, MutableMapping):
+                source = {"message": str(source)}
+            payload: MutableMapping[str, object] = dict(source)
+            timestamp = source.get("@timestamp") or source.get("timestamp")
+            message = source.get("message") or hit.get("_id")
+            yield self._normalize_common_fields(
+                payload,
+                event=source.get("event", "elk_event"),
+                message=str(message) if message else None,
+                timestamp=str(timestamp) if timestamp else None,
+                metadata={"index": hit.get("_index"), "id": hit.get("_id")},
+            )
 
-    def _scroll_batches(self) -> Iterator[list[Mapping[str, object]]]:
+    def _scroll_hits(self) -> Iterator[Mapping[str, object]]:
         page_size = int(self.config.options.get("page_size", 500))
+        keep_alive = str(self.config.options.get("scroll", "1m"))
+        max_docs = self.config.options.get("max_docs", page_size)
+        if max_docs is not None:
+            max_docs = int(max_docs)
+            if max_docs < 1:
+                raise ValueError(f"ElasticsearchConnector 'max_docs' must be at least 1, got {max_docs}.")
+            page_size = min(page_size, max_docs)
+        # A single page needs no scroll context on the cluster
+        scroll = max_docs is None or max_docs > page_size
         endpoint = self.config.options.get("endpoint")
         index = self.config.options.get("index")
         if not endpoint or not index:
@@ -64,19 +83,78 @@ class ElasticsearchConnector(LogConnector):
             session.auth = (auth_options["username"], auth_options["password"])
 
         query_body = self.config.options.get("query") or self.DEFAULT_QUERY
-        url = f"{endpoint.rstrip('/')}/{index}/_search"
+        base_url = endpoint.rstrip("/")
+        scroll_url = f"{base_url}/_search/scroll"
 
         LOGGER.debug("Querying Elasticsearch index %s at %s", index, endpoint)
-        response = session.post(
-            url,
-            json=query_body,
-            params={"size": page_size},
-            timeout=30,
-            verify=verify,
-        )
-        response.raise_for_status()
-        data = response.json()
-        hits = data.get("hits", {}).get("hits", [])
-        for batch in batched(hits, page_size):
-            yield batch
+        state: dict[str, str] = {}
+        params: dict[str, object] = {"size": page_size}
+        if scroll:
+            params["scroll"] = keep_alive
+        returned = 0
+        try:
+            response = session.post(
+                f"{base_url}/{index}/_search",
+                json=query_body,
+                params=params,
+                timeout=30,
+                verify=verify,
+                stream=True,
+            )
+            while True:
+                page_hits = 0
+                with response:
+                    response.raise_for_status()
+                    for hit in self._iter_page_hits(response, state):
+                        page_hits += 1
+                        returned += 1
+                        yield hit
+                        if max_docs is not None and returned >= max_docs:
+                            return
+                scroll_id = state.get("scroll_id")
+                if not page_hits or not scroll_id:
+                    break
+                response = session.post(
+                    scroll_url,
+                    json={"scroll": keep_alive, "scroll_id": scroll_id},
+                    timeout=30,
+                    verify=verify,
+                    stream=True,
+                )
+        finally:
+            scroll_id = state.get("scroll_id")
+            if scroll_id:
+                try:
+                    session.delete(scroll_url, json={"scroll_id": [scroll_id]}, timeout=30, verify=verify)
+                except requests.RequestException as exc:
+                    LOGGER.warning("Failed to clear Elasticsearch scroll context: %s", exc)
+            session.close()
+
+    @staticmethod
+    def _iter_page_hits(response: requests.Response, state: dict[str, str]) -> Iterator[Mapping[str, object]]:
+        """
+        Yield hits from one search/scroll page, recording its `_scroll_id` in `state`.
+
+        With ijson installed the body is parsed incrementally from the socket so
+        only one hit is materialised at a time; otherwise the page is decoded whole.
+        """
+        if ijson is None:
+            data = response.json()
+            if data.get("_scroll_id"):
+                state["scroll_id"] = data["_scroll_id"]
+            yield from data.get("hits", {}).get("hits", [])
+            return
 
+        response.raw.decode_content = True
+        builder = None
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == HITS_PREFIX and event == "end_map":
+                    yield builder.value
+                    builder = None
+            elif prefix == HITS_PREFIX and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "_scroll_id" and event == "string":
+                state["scroll_id"] = value
@@ -4,12 +4,21 @@ Local filesystem connector for newline-delimited JSON logs.
 from __future__ import annotations
 
 import json
+import mmap
 from pathlib import Path
 from typing import Iterable, Iterator
 
+try:  # Optional fast JSON decoder
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from .base import ConnectorConfig, LogConnector, NormalizedRecord
 
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 class JSONLinesConnector(LogConnector):
     """
     Simple connector reading newline-delimited JSON logs from disk.
@@ -28,16 +37,18 @@ class JSONLinesConnector(LogConnector):
         return self._read_file()
 
     def _read_file(self) -> Iterator[NormalizedRecord]:
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
-                    record = {"message": line}
-                if not isinstance(record, dict):
-                    record = {"message": str(record)}
-                yield self._normalize_common_fields(record, metadata={"path": str(self.path)})
-
+        metadata = {"path": str(self.path)}
+        with self.path.open("rb") as handle:
+            if self.path.stat().st_size == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for line in iter(mapped.readline, b""):
+                    if line.isspace():
+                        continue
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        record = {"message": line.strip().decode("utf-8", errors="replace")}
+                    if not isinstance(record, dict):
+                        record = {"message": str(record)}
+                    yield self._normalize_common_fields(record, metadata=metadata)
@@ -3,8 +3,10 @@ Transformer-based embedding utilities for log messages.
 """
 from __future__ import annotations
 
+import contextlib
 import logging
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Iterable, List, Sequence
 
 import numpy as np
@@ -12,6 +14,8 @@ import numpy as np
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_ONNX_CACHE = Path("./.cache/onnx")
+QUANTIZED_FILE_NAME = "model_quantized.onnx"
 
 
 def _safe_import_sentence_transformers():
@@ -23,20 +27,48 @@ def _safe_import_sentence_transformers():
     return SentenceTransformer
 
 
+def _safe_import_onnx_runtime():
+    try:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+    except Exception as exc:  # pragma: no cover - optional dependency
+        LOGGER.warning("optimum[onnxruntime] unavailable: %s", exc)
+        return None
+    return ORTModelForFeatureExtraction, ORTQuantizer, AutoQuantizationConfig, AutoTokenizer
+
+
 @dataclass(slots=True)
 class EmbeddingService:
     """
     Lazily loads a sentence-transformers model and generates embeddings for logs.
+
+    With ``backend="onnx"`` the model is exported once to an INT8 dynamically
+    quantized ONNX graph (via optimum) and run directly on ONNX Runtime, falling
+    back to sentence-transformers when optimum is not installed.
     """
 
     model_name: str = DEFAULT_MODEL_NAME
     batch_size: int = 32
     device: str | None = None
+    backend: str = "sentence-transformers"
+    max_seq_length: int = 256
+    max_workers: int = 4
+    multi_process_threshold: int = 10_000
+    # np.float16 halves embedding memory; cosine and IsolationForest consumers tolerate it
+    dtype: type = np.float32
+    onnx_cache_dir: Path | None = None
     _model: object | None = field(default=None, init=False, repr=False)
+    _session: object | None = field(default=None, init=False, repr=False)
+    _tokenizer: object | None = field(default=None, init=False, repr=False)
 
     def ensure_model(self) -> bool:
-        if self._model is not None:
+        if self._model is not None or self._session is not None:
             return True
+        if self.backend == "onnx":
+            if self._load_onnx_model():
+                return True
+            LOGGER.info("Falling back to sentence-transformers for %s", self.model_name)
         SentenceTransformer = _safe_import_sentence_transformers()
         if not SentenceTransformer:
             return False
@@ -51,16 +83,104 @@ class EmbeddingService:
             LOGGER.warning("Failed to load transformer model %s: %s%s", self.model_name, exc, hint)
             self._model = None
             return False
+        if self.device and self.device.startswith("cuda"):
+            self._model.half()
+        return True
+
+    def _load_onnx_model(self) -> bool:
+        onnx_runtime = _safe_import_onnx_runtime()
+        if not onnx_runtime:
+            return False
+        ORTModelForFeatureExtraction, ORTQuantizer, AutoQuantizationConfig, AutoTokenizer = onnx_runtime
+        cache_dir = (self.onnx_cache_dir or DEFAULT_ONNX_CACHE) / self.model_name.replace("/", "__")
+        try:
+            if not (cache_dir / QUANTIZED_FILE_NAME).exists():
+                LOGGER.info("Exporting %s to quantized ONNX in %s", self.model_name, cache_dir)
+                exported = ORTModelForFeatureExtraction.from_pretrained(self.model_name, export=True)
+                quantizer = ORTQuantizer.from_pretrained(exported)
+                quantizer.quantize(
+                    save_dir=cache_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+                )
+                AutoTokenizer.from_pretrained(self.model_name).save_pretrained(cache_dir)
+            model = ORTModelForFeatureExtraction.from_pretrained(
+                cache_dir, file_name=QUANTIZED_FILE_NAME, provider="CPUExecutionProvider"
+            )
+            self._tokenizer = AutoTokenizer.from_pretrained(cache_dir)
+        except Exception as exc:  # pragma: no cover - runtime export issues
+            LOGGER.warning("Failed to prepare ONNX model %s: %s", self.model_name, exc)
+            self._tokenizer = None
+            return False
+        self._session = model.model
         return True
 
+    def _encode_onnx(self, texts: List[str], progress_bar: object | None) -> np.ndarray:
+        input_names = [item.name for item in self._session.get_inputs()]
+        # Length-sorted batches keep padding per batch small; rows are restored afterwards.
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        ordered_texts = [texts[idx] for idx in order]
+        batches: List[np.ndarray] = []
+        for start in range(0, len(ordered_texts), self.batch_size):
+            batch = ordered_texts[start : start + self.batch_size]
+            encoded = self._tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np",
+            )
+            feed = {name: encoded[name].astype(np.int64, copy=False) for name in input_names if name in encoded}
+            if "token_type_ids" in input_names and "token_type_ids" not in feed:
+                feed["token_type_ids"] = np.zeros_like(feed["input_ids"])
+            token_states = self._session.run(None, feed)[0]
+            # Mean pooling over non-padding tokens, matching the sentence-transformers head
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_states * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(pooled)
+            if progress_bar:
+                progress_bar.update(len(batch))
+        embeddings = np.empty((len(texts), batches[0].shape[1]), dtype=np.float32)
+        embeddings[order] = np.concatenate(batches, axis=0)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.clip(norms, 1e-12, None)
+
+    def _encode_sentence_transformers(self, texts: List[str], show_progress_bar: bool) -> np.ndarray:
+        # sentence-transformers already length-sorts inside encode(); only grad tracking and cores are tuned here.
+        try:
+            import torch
+
+            inference = torch.inference_mode()
+        except ImportError:  # pragma: no cover - torch ships with sentence-transformers
+            inference = contextlib.nullcontext()
+        with inference:
+            if len(texts) > self.multi_process_threshold and self.max_workers > 1 and self.device in (None, "cpu"):
+                LOGGER.info("Encoding %d texts across %d worker processes", len(texts), self.max_workers)
+                pool = self._model.start_multi_process_pool(target_devices=["cpu"] * self.max_workers)
+                try:
+                    return self._model.encode_multi_process(
+                        texts,
+                        pool,
+                        batch_size=self.batch_size,
+                        normalize_embeddings=True,
+                    )
+                finally:
+                    self._model.stop_multi_process_pool(pool)
+            return self._model.encode(
+                texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=show_progress_bar,
+            )
+
     def embed_texts(self, texts: Sequence[str], show_progress: bool = True) -> np.ndarray:
         if not texts:
-            return np.zeros((0, 0), dtype=np.float32)
+            return np.zeros((0, 0), dtype=self.dtype)
         if not self.ensure_model():
             raise RuntimeError(
                 "Sentence transformer model not available. Install 'sentence-transformers' to use embedding features."
             )
-        text_list = list(texts)
+        text_list = texts if isinstance(texts, list) else list(texts)
         total = len(text_list)
         
         # Use progress bar for large batches
@@ -74,25 +194,26 @@ class EmbeddingService:
         else:
             progress_bar = None
         
+        if self._session is not None:
+            try:
+                return np.ascontiguousarray(self._encode_onnx(text_list, progress_bar), dtype=self.dtype)
+            finally:
+                if progress_bar:
+                    progress_bar.close()
+
         try:
-            embeddings = self._model.encode(
-                text_list,
-                batch_size=self.batch_size,
-                convert_to_numpy=True,
-                normalize_embeddings=True,
-                show_progress_bar=progress_bar is not None,
-            )
+            embeddings = self._encode_sentence_transformers(text_list, progress_bar is not None)
             if progress_bar:
                 progress_bar.update(total)
         finally:
             if progress_bar:
                 progress_bar.close()
         
-        return embeddings.astype(np.float32)
+        return np.ascontiguousarray(embeddings, dtype=self.dtype)
 
     def embed_text(self, text: str) -> np.ndarray:
         vectors = self.embed_texts([text])
         if vectors.size == 0:
-            return np.zeros((0,), dtype=np.float32)
+            return np.zeros((0,), dtype=self.dtype)
         return vectors[0]
 
@@ -13,6 +13,10 @@ from .connectors import (
     JSONLinesConnector,
     LogConnector,
 )
+from .connectors.base import PrefetchIterator
+
+# Records buffered ahead per network connector while earlier sources are consumed
+PREFETCH_RECORDS = 2048
 
 CONNECTOR_REGISTRY: Dict[str, Type[LogConnector]] = {
     "json-lines": JSONLinesConnector,
@@ -44,7 +48,23 @@ def load_connectors_from_path(path: str) -> List[LogConnector]:
 
 
 def aggregate_logs(connectors: Sequence[LogConnector]) -> Iterator[dict]:
-    for connector in connectors:
-        for record in connector.fetch():
-            yield record
+    """
+    Yield records from each connector in order.
 
+    Connectors flagged with `prefetch` start fetching immediately on background
+    threads, so remote pages are downloaded while earlier sources are processed.
+    """
+    prefetched: List[PrefetchIterator | None] = [
+        PrefetchIterator(connector.fetch(), PREFETCH_RECORDS, name=f"logminer-{connector.config.name}")
+        if connector.prefetch
+        else None
+        for connector in connectors
+    ]
+    try:
+        for connector, stream in zip(connectors, prefetched):
+            for record in stream if stream is not None else connector.fetch():
+                yield record
+    finally:
+        for stream in prefetched:
+            if stream is not None:
+                stream.close()
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Sequence, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover
     from tensorflow import keras
@@ -19,6 +19,20 @@ LOGGER = logging.getLogger(__name__)
 MAX_SEQUENCE_LENGTH = 50
 
 
+def _pad_post(sequences: Sequence[Sequence[int]], maxlen: int, value: int) -> np.ndarray:
+    """
+    Post-pad/post-truncate sequences into one preallocated int32 matrix.
+
+    Same result as ``pad_sequences(..., padding="post", truncating="post")``
+    without the per-sequence array conversions.
+    """
+    padded = np.full((len(sequences), maxlen), value, dtype=np.int32)
+    for row, sequence in enumerate(sequences):
+        length = min(len(sequence), maxlen)
+        padded[row, :length] = sequence[:length]
+    return padded
+
+
 @dataclass(slots=True)
 class JourneyModelConfig:
     embedding_dim: int = 64
@@ -30,6 +44,11 @@ class JourneyModelConfig:
     batch_size: int = 32
     min_sequences: int = 50
     max_sequence_length: int = MAX_SEQUENCE_LENGTH
+    # Input shapes are fixed by max_sequence_length, so XLA can compile train/predict steps
+    jit_compile: bool = True
+    # Opt-in Keras dtype policy for the hidden layers (e.g. "mixed_float16"); "auto" uses
+    # mixed_float16 only when a GPU is visible. The softmax head always stays float32.
+    mixed_precision: str | None = None
 
 
 @dataclass(slots=True)
@@ -50,6 +69,8 @@ class JourneyAnalyzer:
     label_encoder: LabelEncoder = field(default_factory=LabelEncoder, init=False)
     model: "keras.Model | None" = field(default=None, init=False)
     trained: bool = field(default=False, init=False)
+    _event_to_idx: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _predict_fn: Callable[[np.ndarray], np.ndarray] | None = field(default=None, init=False, repr=False)
 
     def fit(self, journeys: Dict[str, Sequence[str]]) -> None:
         keras = self._lazy_import_keras()
@@ -75,16 +96,11 @@ class JourneyAnalyzer:
             return
 
         self.label_encoder.fit(unique_events)
-        encoded_sequences = [self.label_encoder.transform(seq) for seq in sequences]
+        self._event_to_idx = self._index_classes()
+        encoded_sequences = [self._encode(seq) for seq in sequences]
         num_events = len(self.label_encoder.classes_)
         padding_token = num_events
-        padded_sequences = keras.utils.pad_sequences(
-            encoded_sequences,
-            maxlen=self.config.max_sequence_length,
-            padding="post",
-            truncating="post",
-            value=padding_token,
-        )
+        padded_sequences = _pad_post(encoded_sequences, self.config.max_sequence_length, padding_token)
         X, y = self._build_training_pairs(padded_sequences, padding_token, num_events)
         if X.size == 0 or y.size == 0:
             LOGGER.info("Skipping journey model training: insufficient data after padding.")
@@ -99,6 +115,7 @@ class JourneyAnalyzer:
             batch_size=self.config.batch_size,
             verbose=0,
         )
+        self._predict_fn = self._build_predict_fn(self.model)
         self.trained = True
 
     def analyze(self, journeys: Dict[str, Sequence[str]]) -> JourneyInsights:
@@ -107,31 +124,43 @@ class JourneyAnalyzer:
         if keras is None or not self.trained or not self.model:
             return insights
 
-        num_events = len(self.label_encoder.classes_)
+        classes = self.label_encoder.classes_
+        event_to_idx = self._event_to_idx or self._index_classes()
+        num_events = len(classes)
         padding_token = num_events
+        lookup = event_to_idx.get
+        journey_ids: List[str] = []
+        last_indices: List[int] = []
+        encoded_sequences: List[List[int]] = []
         for journey_id, events in journeys.items():
             if not events:
                 continue
-            known_events = [event for event in events if event in self.label_encoder.classes_]
-            if not known_events:
+            # Single hash probe per event both filters unknown events and encodes the rest
+            encoded = [idx for idx in map(lookup, events) if idx is not None]
+            if not encoded:
                 continue
-            encoded = self.label_encoder.transform(known_events)
-            if encoded.size == 0:
-                continue
-            padded = keras.utils.pad_sequences(
-                [encoded],
-                maxlen=self.config.max_sequence_length - 1,
-                padding="post",
-                truncating="post",
-                value=padding_token,
-            )
-            predictions = self.model.predict(padded, verbose=0)[0]
-            predicted_index = int(np.argmax(predictions))
+            journey_ids.append(journey_id)
+            last_indices.append(encoded[-1])
+            encoded_sequences.append(encoded)
+        if not journey_ids:
+            return insights
+
+        # One padded batch and a single predict call for every journey
+        padded = _pad_post(encoded_sequences, self.config.max_sequence_length - 1, padding_token)
+        predict_fn = self._predict_fn or self._build_predict_fn(self.model)
+        batch_size = self.config.batch_size
+        predictions = np.concatenate(
+            [predict_fn(padded[start : start + batch_size]) for start in range(0, len(padded), batch_size)]
+        )
+        predicted_indices = np.argmax(predictions, axis=1)
+        confidences = np.max(predictions, axis=1)
+        for row, journey_id in enumerate(journey_ids):
+            predicted_index = int(predicted_indices[row])
             if predicted_index >= num_events:
                 continue
-            predicted_event = self.label_encoder.inverse_transform([predicted_index])[0]
-            actual_next = known_events[-1]
-            confidence = float(np.max(predictions))
+            predicted_event = classes[predicted_index]
+            actual_next = classes[last_indices[row]]
+            confidence = float(confidences[row])
             if predicted_event != actual_next and confidence > 0.6:
                 insights.anomalous_sequences.append(
                     {
@@ -141,12 +170,19 @@ class JourneyAnalyzer:
                         "confidence": confidence,
                     }
                 )
-            insights.next_event_probabilities[journey_id] = {
-                event: float(prob)
-                for event, prob in zip(self.label_encoder.classes_, predictions[:num_events])
-            }
+            insights.next_event_probabilities[journey_id] = dict(
+                zip(classes.tolist(), predictions[row, :num_events].tolist())
+            )
         return insights
 
+    def _index_classes(self) -> Dict[str, int]:
+        # Hash lookups replace LabelEncoder.transform's searchsorted and validation per sequence
+        return {event: idx for idx, event in enumerate(self.label_encoder.classes_.tolist())}
+
+    def _encode(self, events: Sequence[str]) -> np.ndarray:
+        lookup = self._event_to_idx
+        return np.fromiter((lookup[event] for event in events), dtype=np.int32, count=len(events))
+
     def _build_training_pairs(
         self, sequences: np.ndarray, padding_token: int, num_events: int
     ) -> Tuple[np.ndarray, np.ndarray]:
@@ -163,24 +199,55 @@ class JourneyAnalyzer:
         y = keras.utils.to_categorical(y_indices, num_classes=num_events + 1)
         return X, y[:, :num_events]
 
+    def _build_predict_fn(self, model: "keras.Model") -> Callable[[np.ndarray], np.ndarray]:
+        """Inference-mode forward pass that skips ``Model.predict``'s per-call Dataset setup."""
+        try:
+            import tensorflow as tf  # type: ignore
+        except Exception:  # pragma: no cover
+            return lambda batch: np.asarray(model.predict_on_batch(batch))
+
+        forward = tf.function(
+            lambda batch: model(batch, training=False),
+            jit_compile=self.config.jit_compile,
+            reduce_retracing=True,
+        )
+        return lambda batch: forward(tf.convert_to_tensor(batch, dtype=tf.int32)).numpy()
+
     def _build_model(self, num_events: int) -> keras.Model:
         keras = self._lazy_import_keras()
         if keras is None:
             raise RuntimeError("TensorFlow/Keras not available.")
-        inputs = keras.Input(shape=(self.config.max_sequence_length - 1,))
-        x = keras.layers.Embedding(num_events, self.config.embedding_dim, mask_zero=True)(inputs)
-        x = keras.layers.LSTM(self.config.lstm_units)(x)
-        x = keras.layers.Dropout(self.config.dropout_rate)(x)
-        x = keras.layers.Dense(self.config.dense_units, activation="relu")(x)
-        outputs = keras.layers.Dense(num_events - 1, activation="softmax")(x)
+        policy = self._layer_policy()
+        inputs = keras.Input(shape=(self.config.max_sequence_length - 1,), dtype="int32")
+        x = keras.layers.Embedding(num_events, self.config.embedding_dim, mask_zero=True, dtype=policy)(inputs)
+        x = keras.layers.LSTM(self.config.lstm_units, dtype=policy)(x)
+        x = keras.layers.Dropout(self.config.dropout_rate, dtype=policy)(x)
+        x = keras.layers.Dense(self.config.dense_units, activation="relu", dtype=policy)(x)
+        outputs = keras.layers.Dense(num_events - 1, activation="softmax", dtype="float32")(x)
         model = keras.Model(inputs, outputs)
+        optimizer = keras.optimizers.Adam(learning_rate=self.config.learning_rate)
+        if policy == "mixed_float16":
+            # compile() only adds loss scaling for a global float16 policy, so wrap explicitly
+            optimizer = keras.mixed_precision.LossScaleOptimizer(optimizer)
         model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=self.config.learning_rate),
+            optimizer=optimizer,
             loss="categorical_crossentropy",
             metrics=["accuracy"],
+            jit_compile=self.config.jit_compile,
         )
         return model
 
+    def _layer_policy(self) -> str:
+        """Per-layer dtype policy, so other Keras models in the process keep the global policy."""
+        precision = self.config.mixed_precision
+        if precision != "auto":
+            return precision or "float32"
+        try:
+            import tensorflow as tf  # type: ignore
+        except Exception:  # pragma: no cover
+            return "float32"
+        return "mixed_float16" if tf.config.list_physical_devices("GPU") else "float32"
+
     @staticmethod
     def _lazy_import_keras():
         try:
@@ -6,8 +6,8 @@ without breaking. Custom mapping can be supplied via config or CLI.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, List, Mapping, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional, Tuple
 
 # Built-in aliases: any of these keys (first match in record) count as the canonical field.
 DEFAULT_TIMESTAMP_ALIASES: Tuple[str, ...] = (
@@ -39,40 +39,49 @@ DEFAULT_SEVERITY_ALIASES: Tuple[str, ...] = (
 )
 
 
-@dataclass(slots=True)
+def _ordered_keys(custom: Optional[str], aliases: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Custom key first (when set), then the built-in aliases without duplicates."""
+    if not custom:
+        return aliases
+    return (custom,) + tuple(k for k in aliases if k != custom)
+
+
+@dataclass(frozen=True, slots=True)
 class LogFormatConfig:
     """
     Optional custom field names. If set, only that key is tried first;
     if not present in record, built-in aliases are used.
+
+    Instances are immutable, so the key orders are resolved once at construction
+    rather than rebuilt for every record checked.
     """
 
     timestamp_field: Optional[str] = None
     message_field: Optional[str] = None
     severity_field: Optional[str] = None
+    _timestamp_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _message_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _severity_keys: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_timestamp_keys", _ordered_keys(self.timestamp_field, DEFAULT_TIMESTAMP_ALIASES))
+        object.__setattr__(self, "_message_keys", _ordered_keys(self.message_field, DEFAULT_MESSAGE_ALIASES))
+        object.__setattr__(self, "_severity_keys", _ordered_keys(self.severity_field, DEFAULT_SEVERITY_ALIASES))
+
+    def timestamp_keys(self) -> Tuple[str, ...]:
+        """Ordered keys to try for timestamp (custom first, then aliases)."""
+        return self._timestamp_keys
+
+    def message_keys(self) -> Tuple[str, ...]:
+        """Ordered keys to try for message (custom first, then aliases)."""
+        return self._message_keys
+
+    def severity_keys(self) -> Tuple[str, ...]:
+        """Ordered keys to try for severity (custom first, then aliases)."""
+        return self._severity_keys
 
-    def timestamp_keys(self) -> List[str]:
-        """Ordered list of keys to try for timestamp (custom first, then aliases)."""
-        keys: List[str] = []
-        if self.timestamp_field:
-            keys.append(self.timestamp_field)
-        keys.extend(k for k in DEFAULT_TIMESTAMP_ALIASES if k not in keys)
-        return keys
-
-    def message_keys(self) -> List[str]:
-        """Ordered list of keys to try for message (custom first, then aliases)."""
-        keys: List[str] = []
-        if self.message_field:
-            keys.append(self.message_field)
-        keys.extend(k for k in DEFAULT_MESSAGE_ALIASES if k not in keys)
-        return keys
-
-    def severity_keys(self) -> List[str]:
-        """Ordered list of keys to try for severity (custom first, then aliases)."""
-        keys: List[str] = []
-        if self.severity_field:
-            keys.append(self.severity_field)
-        keys.extend(k for k in DEFAULT_SEVERITY_ALIASES if k not in keys)
-        return keys
+
+_DEFAULT_CONFIG = LogFormatConfig()
 
 
 def _unwrap_value(v: Any) -> Any:
@@ -82,15 +91,18 @@ def _unwrap_value(v: Any) -> Any:
     return v
 
 
-def _get_first_present(record: Mapping[str, Any], keys: List[str]) -> Tuple[Optional[str], Any]:
+def _get_first_present(record: Mapping[str, Any], keys: Tuple[str, ...]) -> Tuple[Optional[str], Any]:
     """Return (key_used, value) for the first key in keys that exists in record with non-empty value.
     Single-element array values (e.g. [\"x\"]) are unwrapped to the element for the check."""
+    get = record.get
     for k in keys:
-        if k not in record:
-            continue
-        v = record[k]
+        v = get(k)  # one lookup per key; a missing key and an explicit None are both skipped
         if v is None:
             continue
+        if type(v) is str:  # common case: plain string, no unwrapping needed
+            if v.strip():
+                return (k, v)
+            continue
         v = _unwrap_value(v)
         if v is None:
             continue
@@ -110,14 +122,14 @@ def normalize_record(record: Any) -> Any:
 
 def resolve_timestamp_key(record: Mapping[str, Any], config: Optional[LogFormatConfig] = None) -> Optional[str]:
     """Return the key name used for timestamp in this record, or None if missing."""
-    keys = (config or LogFormatConfig()).timestamp_keys()
+    keys = (config or _DEFAULT_CONFIG).timestamp_keys()
     key_used, _ = _get_first_present(record, keys)
     return key_used
 
 
 def resolve_message_key(record: Mapping[str, Any], config: Optional[LogFormatConfig] = None) -> Optional[str]:
     """Return the key name used for message in this record, or None if missing."""
-    keys = (config or LogFormatConfig()).message_keys()
+    keys = (config or _DEFAULT_CONFIG).message_keys()
     key_used, _ = _get_first_present(record, keys)
     return key_used
 
@@ -131,12 +143,12 @@ def has_required_log_fields(
     Returns:
         (True, None) if valid, (False, error_message) if invalid.
     """
-    cfg = config or LogFormatConfig()
+    cfg = config or _DEFAULT_CONFIG
+    # Timestamp is checked first and reported first, so skip the message scan when it is missing
     ts_key, ts_val = _get_first_present(record, cfg.timestamp_keys())
-    msg_key, msg_val = _get_first_present(record, cfg.message_keys())
-
     if ts_key is None or ts_val is None:
         return False, "Missing required field: timestamp (or time, ts, @timestamp, date, datetime)"
+    msg_key, msg_val = _get_first_present(record, cfg.message_keys())
     if msg_key is None or msg_val is None:
         return False, "Missing required field: message (or msg, text, log, body, content, event)"
     return True, None
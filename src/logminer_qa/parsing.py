@@ -6,7 +6,7 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 if TYPE_CHECKING:  # pragma: no cover
     from spacy.language import Language
@@ -20,6 +20,8 @@ STATUS_CODE_PATTERN = re.compile(r"\b(?:status:?|code:?|http/1\.[01])\s*(\d{3})"
 AMOUNT_PATTERN = re.compile(r"\b\d+(?:[.,]\d{2})?\b")
 ACCOUNT_TOKEN_PATTERN = re.compile(r"\[TOKEN_[A-Z0-9]+\]")
 ERROR_TOKEN_PATTERN = re.compile(r"\b(?:ERR|ERROR|EXCEPTION|FAIL)(?:[_-]?\w+)*\b", re.IGNORECASE)
+DIGIT_PATTERN = re.compile(r"\d")
+NLP_BATCH_SIZE = 256
 
 
 def _safe_import_spacy() -> Optional["Language"]:
@@ -27,7 +29,8 @@ def _safe_import_spacy() -> Optional["Language"]:
         import spacy
 
         try:
-            return spacy.load("en_core_web_sm")
+            # Only entities and lemmas are read; the dependency parser is dead weight
+            return spacy.load("en_core_web_sm", disable=["parser"])
         except OSError:
             LOGGER.warning("spaCy model 'en_core_web_sm' not found; using blank English model.")
             return spacy.blank("en")
@@ -74,23 +77,65 @@ class LogParser:
     def parse_record(self, record: Any) -> ParsedRecord:
         message = self._extract_message(record)
         parsed = ParsedRecord(message=message)
-        parsed.api_endpoints = self._unique(API_ENDPOINT_PATTERN.findall(message))
-        parsed.status_codes = self._unique(STATUS_CODE_PATTERN.findall(message))
-        parsed.monetary_values = self._unique(AMOUNT_PATTERN.findall(message))
-        parsed.account_tokens = self._unique(ACCOUNT_TOKEN_PATTERN.findall(message))
-        parsed.error_tokens = self._unique(ERROR_TOKEN_PATTERN.findall(message))
+        self._apply_patterns(parsed, message)
         if self._nlp:
-            doc = self._nlp(message)
-            parsed.entities = [
-                {"text": ent.text, "label": ent.label_} for ent in doc.ents if ent.text.strip()
-            ]
-            parsed.keywords = self._unique(
-                token.lemma_.lower()
-                for token in doc
-                if token.is_alpha and not token.is_stop and len(token.text) > 2
-            )
+            self._apply_doc(parsed, self._nlp(message))
         return parsed
 
+    def parse_records(self, records: Sequence[Any]) -> List[ParsedRecord]:
+        """
+        Parse a batch of records, streaming messages through spaCy with `nlp.pipe`.
+
+        Equivalent to calling `parse_record` on each record, without paying the
+        pipeline dispatch cost per message.
+        """
+        parsed_records: List[ParsedRecord] = []
+        for record in records:
+            message = self._extract_message(record)
+            parsed = ParsedRecord(message=message)
+            self._apply_patterns(parsed, message)
+            parsed_records.append(parsed)
+        if self._nlp and parsed_records:
+            docs = self._nlp.pipe((parsed.message for parsed in parsed_records), batch_size=NLP_BATCH_SIZE)
+            for parsed, doc in zip(parsed_records, docs):
+                self._apply_doc(parsed, doc)
+        return parsed_records
+
+    def _apply_doc(self, parsed: ParsedRecord, doc: Any) -> None:
+        parsed.entities = [{"text": ent.text, "label": ent.label_} for ent in doc.ents if ent.text.strip()]
+        parsed.keywords = self._unique(
+            token.lemma_.lower() for token in doc if token.is_alpha and not token.is_stop and len(token.text) > 2
+        )
+
+    @staticmethod
+    def _apply_patterns(parsed: ParsedRecord, message: str) -> None:
+        """
+        Run the field regexes, skipping any whose required literal is absent.
+
+        The patterns stay separate because their matches overlap (a status code is
+        also a monetary value), which a single alternation would not report. Regex
+        captures never carry whitespace, so order-preserving dict dedup replaces `_unique`.
+        """
+        has_digit = DIGIT_PATTERN.search(message) is not None
+        if message.isascii():
+            # IGNORECASE also folds a few non-ASCII letters, so substring prefilters are ASCII-only
+            lowered = message.lower()
+            maybe_api = "/" in message
+            maybe_status = has_digit and ("status" in lowered or "code" in lowered or "http/1." in lowered)
+            maybe_error = "err" in lowered or "exception" in lowered or "fail" in lowered
+        else:
+            maybe_api = maybe_status = maybe_error = True
+        if maybe_api:
+            parsed.api_endpoints = list(dict.fromkeys(API_ENDPOINT_PATTERN.findall(message)))
+        if maybe_status:
+            parsed.status_codes = list(dict.fromkeys(STATUS_CODE_PATTERN.findall(message)))
+        if has_digit:
+            parsed.monetary_values = list(dict.fromkeys(AMOUNT_PATTERN.findall(message)))
+        if "[TOKEN_" in message:
+            parsed.account_tokens = list(dict.fromkeys(ACCOUNT_TOKEN_PATTERN.findall(message)))
+        if maybe_error:
+            parsed.error_tokens = list(dict.fromkeys(ERROR_TOKEN_PATTERN.findall(message)))
+
     def _extract_message(self, record: Any) -> str:
         if isinstance(record, str):
             return record
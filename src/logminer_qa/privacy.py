@@ -8,6 +8,8 @@ import random
 from dataclasses import dataclass, field
 from typing import Dict, Mapping, Tuple
 
+import numpy as np
+
 from .config import PrivacyConfig
 
 
@@ -22,6 +24,7 @@ def laplace_noise(scale: float) -> float:
 @dataclass(slots=True)
 class DifferentialPrivacyAggregator:
     config: PrivacyConfig = field(default_factory=PrivacyConfig)
+    _rng: np.random.Generator = field(default_factory=np.random.default_rng, init=False, repr=False)
 
     def aggregate_counts(self, counts: Mapping[str, int]) -> Dict[str, int]:
         """
@@ -33,12 +36,14 @@ class DifferentialPrivacyAggregator:
         epsilon = max(self.config.epsilon, 1e-3)
         sensitivity = 1.0
         scale = sensitivity / epsilon
-        noisy: Dict[str, int] = {}
-        for key, value in counts.items():
-            noise = laplace_noise(scale)
-            perturbed = max(0, int(round(value + noise)))
-            noisy[key] = perturbed
-        return noisy
+        keys = list(counts)
+        if not keys:
+            return {}
+        # One vectorised draw for every bucket; rint rounds half-to-even like round()
+        values = np.fromiter((counts[key] for key in keys), dtype=np.float64, count=len(keys))
+        noise = self._rng.laplace(0.0, scale, size=len(keys))
+        perturbed = np.maximum(0, np.rint(values + noise)).astype(np.int64)
+        return dict(zip(keys, perturbed.tolist()))
 
     def aggregate_histogram(self, buckets: Mapping[str, int]) -> Dict[str, int]:
         """
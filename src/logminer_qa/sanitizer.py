@@ -4,47 +4,102 @@ and referential hashing before logs reach the analysis engine.
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from hashlib import new as hashlib_new
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+from hashlib import blake2b, new as hashlib_new
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from .config import SanitizerConfig
 from .token_store import TokenStore
 
+try:  # Optional SIMD keyed hash
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+try:  # Optional SIMD multi-pattern prescan
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
 LOGGER = logging.getLogger(__name__)
 
+SANITIZE_BATCH_SIZE = 256
+# Above this many raw matches, spans are deduplicated by bucketing on start offset
+SPAN_BUCKET_THRESHOLD = 64
+# Keyed hash_algorithm values; any other value is a hashlib name fed secret + value
+KEYED_BLAKE2B = "blake2b-keyed"
+KEYED_BLAKE3 = "blake3"
+
 
 _DEFAULT_PATTERNS: Iterable[Tuple[str, str]] = (
     ("ACCOUNT", r"\b\d{10,18}\b"),
-    ("CREDIT_CARD", r"\b(?:\d[ -]*?){13,16}\b"),
+    # Starts and ends on a digit, so separators never open or close a span
+    ("CREDIT_CARD", r"\b\d(?:[ -]*\d){12,15}\b"),
     ("EMAIL", r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"),
     ("IBAN", r"\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b"),
     ("PHONE", r"\+?\d{9,15}"),
     ("SSN", r"\b\d{3}-\d{2}-\d{4}\b"),
 )
+# Every default pattern needs a digit or "@" to match; text with neither skips the regexes.
+# `re`'s \d also matches non-ASCII digits, so non-ASCII text is gated with the regex class.
+_DEFAULT_TRIGGER_BYTES = b"0123456789@"
+_DEFAULT_TRIGGER_RE = re.compile(r"[\d@]")
+
+
+def _compile_prescan_database(patterns: Sequence[Tuple[str, str]]):
+    """Hyperscan yes/no gate for ASCII text (spans still come from `re`), or None."""
+    if hyperscan is None or not patterns:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode("ascii") for _, pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+        )
+    except (UnicodeEncodeError, hyperscan.error) as exc:
+        LOGGER.debug("Hyperscan prescan disabled: %s", exc)
+        return None
+    return database
+
+
+@functools.lru_cache(maxsize=16)
+def _build_detector_state(
+    patterns: Tuple[Tuple[str, str], ...],
+) -> Tuple[Tuple[Tuple[str, re.Pattern[str]], ...], Optional[re.Pattern[str]], Any]:
+    """Per-pattern regexes, their combined alternation and the prescan database, cached per pattern set."""
+    compiled = tuple((label, re.compile(pattern)) for label, pattern in patterns)
+    if patterns != _DEFAULT_PATTERNS:
+        # Joining renumbers capture groups and Hyperscan's regex dialect differs from `re`;
+        # only the built-in patterns are known to behave identically under both gates
+        return compiled, None, None
+    combined = re.compile("|".join(f"(?:{pattern})" for _, pattern in patterns))
+    return compiled, combined, _compile_prescan_database(patterns)
+
+
+def _stop_scan(_id: int, _start: int, _end: int, _flags: int, _context: object) -> bool:
+    return True  # first match answers the question; abort the scan
 
 
-def _iter_strings(record: Any) -> Iterable[Tuple[List[str], str]]:
-    """
-    Yield (path, value) pairs for any string leaves inside ecord.
-    """
-    if isinstance(record, str):
-        yield ([], record)
-        return
+_JSON_SCALARS = (int, float, bool, type(None))
 
-    if isinstance(record, Mapping):
-        for key, value in record.items():
-            for path, sub_value in _iter_strings(value):
-                yield ([str(key), *path], sub_value)
-        return
 
-    if isinstance(record, list):
-        for idx, value in enumerate(record):
-            for path, sub_value in _iter_strings(value):
-                yield ([str(idx), *path], sub_value)
+def _json_key(key: Any) -> str:
+    """Key as ``json.dumps`` would write it (str, int, float, bool and None are allowed)."""
+    if isinstance(key, str):
+        return str(key)
+    if isinstance(key, _JSON_SCALARS):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
 
 
 @dataclass(slots=True)
@@ -57,11 +112,56 @@ class SanitizationResult:
 @dataclass(slots=True)
 class PatternDetector:
     patterns: Iterable[Tuple[str, str]] = field(default_factory=lambda: _DEFAULT_PATTERNS)
+    _compiled: Sequence[Tuple[str, re.Pattern[str]]] = field(default=(), init=False, repr=False)
+    _combined: Optional[re.Pattern[str]] = field(default=None, init=False, repr=False)
+    _compiled_from: Any = field(default=None, init=False, repr=False)
+    _prescan: Any = field(default=None, init=False, repr=False)
+    # Hyperscan scans release the GIL, so each detector scans with its own scratch space
+    _prescan_scratch: Any = field(default=None, init=False, repr=False)
+    _trigger_gate: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._compile()
+
+    def _compile(self) -> None:
+        """Compile ``patterns`` once; redone only if the attribute is reassigned."""
+        self.patterns = tuple((label, pattern) for label, pattern in self.patterns)
+        self._compiled_from = self.patterns
+        self._compiled, self._combined, self._prescan = _build_detector_state(self.patterns)
+        self._prescan_scratch = self._prescan.scratch.clone() if self._prescan is not None else None
+        self._trigger_gate = self.patterns == _DEFAULT_PATTERNS
 
     def find_matches(self, text: str) -> List[Tuple[str, Tuple[int, int]]]:
+        """Every match of every pattern, grouped by pattern in declaration order."""
+        if self.patterns is not self._compiled_from:
+            self._compile()
+        if self._trigger_gate:
+            if text.isascii():
+                encoded = text.encode("ascii")
+                if len(encoded.translate(None, _DEFAULT_TRIGGER_BYTES)) == len(encoded):
+                    return []
+            elif _DEFAULT_TRIGGER_RE.search(text) is None:
+                return []
+        # Hyperscan's \d, \b and classes are ASCII-only, so only ASCII text takes the SIMD gate
+        if self._prescan is not None and text.isascii():
+            try:
+                self._prescan.scan(
+                    text.encode("ascii"), match_event_handler=_stop_scan, scratch=self._prescan_scratch
+                )
+            except hyperscan.ScanTerminated:
+                pass
+            else:
+                return []
+        # No pattern matches before the alternation's first hit, so per-pattern scans start there
+        start = 0
+        if self._combined is not None:
+            first = self._combined.search(text)
+            if first is None:
+                return []
+            start = first.start()
         matches: List[Tuple[str, Tuple[int, int]]] = []
-        for label, pattern in self.patterns:
-            for match in re.finditer(pattern, text):
+        for label, pattern in self._compiled:
+            for match in pattern.finditer(text, start):
                 matches.append((label, match.span()))
         return matches
 
@@ -71,6 +171,10 @@ class SanitizationLayer:
     config: SanitizerConfig = field(default_factory=SanitizerConfig)
     token_store: TokenStore = field(default_factory=TokenStore)
     pattern_detector: PatternDetector = field(default_factory=PatternDetector)
+    # (env var name, secret bytes) resolved on first hash; re-resolved if the config's env var changes
+    _secret_cache: Optional[Tuple[str, bytes]] = field(default=None, init=False, repr=False)
+    # ((algorithm, env var name), hasher with the secret already absorbed); copied per value
+    _hash_proto: Optional[Tuple[Tuple[str, str], Any]] = field(default=None, init=False, repr=False)
 
     def sanitize_record(self, record: Any) -> SanitizationResult:
         """
@@ -87,15 +191,10 @@ class SanitizationLayer:
                 sanitized=payload, redaction_map=redactions, hashed_fields=hashed
             )
 
-        cloned = json.loads(json.dumps(record))
+        # One bottom-up walk builds the sanitized copy; the caller's record is never mutated
         redaction_map: Dict[str, str] = {}
         hashed_fields: Dict[str, str] = {}
-        for path, value in _iter_strings(cloned):
-            sanitized, redactions, hashed = self._sanitize_text(value)
-            if sanitized != value:
-                self._apply_path(cloned, path, sanitized)
-            redaction_map.update(self._qualify_keys(path, redactions))
-            hashed_fields.update(self._qualify_keys(path, hashed))
+        cloned = self._sanitize_tree(record, (), redaction_map, hashed_fields)
 
         sanitized_payload: Any = cloned
         if isinstance(cloned, dict):
@@ -109,68 +208,176 @@ class SanitizationLayer:
             hashed_fields=hashed_fields,
         )
 
-    def _apply_path(self, root: MutableMapping[str, Any] | list, path: List[str], value: str) -> None:
-        target: Any = root
-        for key in path[:-1]:
-            try:
-                idx = int(key)
-                target = target[idx]
-            except ValueError:
-                target = target[key]
-        final_key = path[-1]
-        try:
-            idx = int(final_key)
-            target[idx] = value
-        except ValueError:
-            target[final_key] = value
-
-    def _qualify_keys(self, path: List[str], mapping: Dict[str, str]) -> Dict[str, str]:
-        if not path:
-            return mapping
-        prefix = ".".join(path)
-        return {f"{prefix}.{key}" if key else prefix: value for key, value in mapping.items()}
-
-    def _sanitize_text(self, text: str) -> Tuple[str, Dict[str, str], Dict[str, str]]:
-        redactions: Dict[str, str] = {}
-        hashed_fields: Dict[str, str] = {}
+    def sanitize_many(
+        self,
+        records: Iterable[Any],
+        workers: Optional[int] = None,
+        batch_size: int = SANITIZE_BATCH_SIZE,
+    ) -> Iterator[SanitizationResult]:
+        """
+        Sanitize independent records across worker processes, yielding results in input order.
+
+        Records are shipped in batches of `batch_size`; each worker builds its own layer
+        (patterns compile once per process) seeded with this layer's tokens, and tokens
+        minted by workers are merged back into `token_store`. At most two batches per
+        worker are in flight. `workers` defaults to the CPU count; 1 runs in-process.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            for record in records:
+                yield self.sanitize_record(record)
+            return
+
+        iterator = iter(records)
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_sanitize_worker,
+            initargs=(
+                self.config,
+                tuple(self.pattern_detector.patterns),
+                (self.token_store.token_prefix, self.token_store.token_suffix),
+                self.token_store.snapshot(),
+            ),
+        ) as executor:
+            while batch := list(islice(iterator, batch_size)):
+                pending.append(executor.submit(_sanitize_batch_in_worker, batch))
+                if len(pending) >= workers * 2:
+                    yield from self._collect_batch(pending.popleft())
+            while pending:
+                yield from self._collect_batch(pending.popleft())
+
+    def _collect_batch(self, future: Future) -> List[SanitizationResult]:
+        results, new_tokens = future.result()
+        self.token_store.merge(new_tokens)
+        return results
+
+    def _sanitize_tree(
+        self,
+        node: Any,
+        path: Tuple[str, ...],
+        redaction_map: Dict[str, str],
+        hashed_fields: Dict[str, str],
+    ) -> Any:
+        """Sanitized copy of a JSON-like tree, shaped like a ``json.loads(json.dumps(node))`` clone."""
+        node_type = type(node)
+        if node_type is str:
+            return self._sanitize_text(node, path, redaction_map, hashed_fields)[0]
+        if node_type is dict:
+            cloned: Dict[str, Any] = {}
+            for key, value in node.items():
+                key = key if type(key) is str else _json_key(key)
+                cloned[key] = self._sanitize_tree(value, (*path, key), redaction_map, hashed_fields)
+            return cloned
+        if node_type is list or node_type is tuple:
+            return [
+                self._sanitize_tree(value, (*path, str(idx)), redaction_map, hashed_fields)
+                for idx, value in enumerate(node)
+            ]
+        if node_type is int or node_type is float or node_type is bool or node is None:
+            return node
+        return self._sanitize_tree(json.loads(json.dumps(node)), path, redaction_map, hashed_fields)
+
+    def _sanitize_text(
+        self,
+        text: str,
+        path: Sequence[str] = (),
+        redactions: Optional[Dict[str, str]] = None,
+        hashed_fields: Optional[Dict[str, str]] = None,
+    ) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Redact `text`, writing entries keyed ``<path>.<token>`` straight into the given maps."""
+        redactions = {} if redactions is None else redactions
+        hashed_fields = {} if hashed_fields is None else hashed_fields
         spans = self._collect_spans(text)
         if not spans:
             return text, redactions, hashed_fields
 
+        prefix = ".".join(path) if path else None
+
         fragments: List[str] = []
         cursor = 0
-        for label, span in sorted(spans, key=lambda item: item[1][0]):
-            start, end = span
+        for label, (start, end) in spans:
             fragments.append(text[cursor:start])
             original = text[start:end]
             token = self.token_store.get_token(original)
             fragments.append(token)
-            redactions[token] = label
-            hashed_fields[token] = self._hash_value(original)
+            key = token if prefix is None else f"{prefix}.{token}"
+            redactions[key] = label
+            hashed_fields[key] = self._hash_value(original)
             cursor = end
         fragments.append(text[cursor:])
         sanitized = "".join(fragments)
         return sanitized, redactions, hashed_fields
 
     def _collect_spans(self, text: str) -> List[Tuple[str, Tuple[int, int]]]:
-        spans = list(self.pattern_detector.find_matches(text))
-        # Deduplicate overlapping spans by choosing the longest window
+        spans = self.pattern_detector.find_matches(text)
+        # Deduplicate overlapping spans by choosing the longest window; result is in start order
+        if len(spans) > SPAN_BUCKET_THRESHOLD:
+            return self._sweep_span_buckets(spans)
         deduped: List[Tuple[str, Tuple[int, int]]] = []
         for label, span in sorted(spans, key=lambda item: (item[1][0], -(item[1][1] - item[1][0]))):
             if not deduped or span[0] >= deduped[-1][1][1]:
                 deduped.append((label, span))
         return deduped
 
+    @staticmethod
+    def _sweep_span_buckets(spans: List[Tuple[str, Tuple[int, int]]]) -> List[Tuple[str, Tuple[int, int]]]:
+        """Sorted-sweep selection via the longest span per start offset (earliest-declared on ties)."""
+        longest: Dict[int, Tuple[str, Tuple[int, int]]] = {}
+        for item in spans:
+            start, end = item[1]
+            current = longest.get(start)
+            if current is None or end > current[1][1]:
+                longest[start] = item
+        deduped: List[Tuple[str, Tuple[int, int]]] = []
+        cursor = -1
+        for start in sorted(longest):
+            item = longest[start]
+            if start >= cursor:
+                deduped.append(item)
+                cursor = item[1][1]
+        return deduped
+
     def _hash_value(self, value: str) -> str:
-        hash_obj = hashlib_new(self.config.hash_algorithm)
-        secret = self._resolve_secret()
-        hash_obj.update(secret.encode("utf-8"))
+        hash_obj = self._hash_prototype().copy()
         hash_obj.update(value.encode("utf-8"))
         return hash_obj.hexdigest()
 
-    def _resolve_secret(self) -> str:
-        import os
+    def _hash_prototype(self) -> Any:
+        cache_key = (self.config.hash_algorithm, self.config.hashing_secret_env)
+        cached = self._hash_proto
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        algorithm = cache_key[0]
+        if algorithm == KEYED_BLAKE2B:
+            # Secret folded into the initial state as the key instead of a prefix update
+            proto = blake2b(key=self._hash_key(64), digest_size=32)
+        elif algorithm == KEYED_BLAKE3:
+            if blake3 is None:
+                raise RuntimeError("hash_algorithm 'blake3' requires the optional 'blake3' package.")
+            proto = blake3(key=self._hash_key(32, exact=True))
+        else:
+            proto = hashlib_new(algorithm)
+            proto.update(self._secret_bytes())
+        self._hash_proto = (cache_key, proto)
+        return proto
 
+    def _hash_key(self, max_size: int, exact: bool = False) -> bytes:
+        """Secret as a MAC key: used as-is when it fits, else condensed with BLAKE2b."""
+        secret = self._secret_bytes()
+        if len(secret) == max_size or (not exact and len(secret) <= max_size):
+            return secret
+        return blake2b(secret, digest_size=max_size).digest()
+
+    def _secret_bytes(self) -> bytes:
+        env_name = self.config.hashing_secret_env
+        cached = self._secret_cache
+        if cached is None or cached[0] != env_name:
+            # One environment lookup (and at most one missing-secret warning) per layer
+            cached = self._secret_cache = (env_name, self._resolve_secret().encode("utf-8"))
+        return cached[1]
+
+    def _resolve_secret(self) -> str:
         secret = os.environ.get(self.config.hashing_secret_env)
         if not secret:
             LOGGER.warning(
@@ -194,4 +401,32 @@ class SanitizationLayer:
                 sanitized = self.sanitize_record(line).sanitized
             else:
                 sanitized = self.sanitize_record(record).sanitized
-            yield json.dumps(sanitized)
+            yield json.dumps(sanitized)
+
+
+_WORKER_SANITIZER: SanitizationLayer | None = None
+
+
+def _init_sanitize_worker(
+    config: SanitizerConfig,
+    patterns: Tuple[Tuple[str, str], ...],
+    token_affixes: Tuple[str, str],
+    token_mapping: Dict[str, str],
+) -> None:
+    """Process-pool initializer: one layer per worker, seeded with the parent's tokens."""
+    global _WORKER_SANITIZER
+    prefix, suffix = token_affixes
+    layer = SanitizationLayer(
+        config=config,
+        token_store=TokenStore(token_prefix=prefix, token_suffix=suffix),
+        pattern_detector=PatternDetector(patterns),
+    )
+    layer.token_store.merge(token_mapping)
+    _WORKER_SANITIZER = layer
+
+
+def _sanitize_batch_in_worker(batch: List[Any]) -> Tuple[List[SanitizationResult], Dict[str, str]]:
+    token_store = _WORKER_SANITIZER.token_store
+    seen = len(token_store)
+    results = [_WORKER_SANITIZER.sanitize_record(record) for record in batch]
+    return results, token_store.snapshot(since=seen)
@@ -8,20 +8,53 @@ log lines without exposing raw PII.
 from __future__ import annotations
 
 import json
+import os
 import threading
 from dataclasses import dataclass, field
 from hashlib import blake2b
+from itertools import islice
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+try:  # Optional fast JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Log entries to accumulate before folding them into the snapshot, at minimum
+COMPACT_MIN_LOG_ENTRIES = 10_000
+_LOG_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _encode_log_entry(entry: Tuple[str, str]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (_LOG_ENCODER.encode(entry) + "\n").encode("utf-8")
+
+
+# Parameter block set up once; copying it is cheaper than a fresh blake2b(digest_size=12)
+_TOKEN_HASHER = blake2b(digest_size=12)
 
 
 def _default_encoder(value: str) -> str:
-    digest = blake2b(value.encode("utf-8"), digest_size=12)
+    digest = _TOKEN_HASHER.copy()
+    digest.update(value.encode("utf-8"))
     return digest.hexdigest().upper()
 
 
 @dataclass(slots=True)
 class TokenStore:
+    """
+    Value -> token mapping, optionally persisted under `store_path`.
+
+    Persistence is a JSON snapshot at `store_path` plus an append-only JSON Lines
+    log beside it (`<store_path>.jsonl`): batches append only their new entries,
+    and the log is folded back into the snapshot once it outgrows it (or on
+    `compact()`), so flush cost stays proportional to the batch, not the mapping.
+    """
+
     store_path: Path | None = None
     token_prefix: str = "[TOKEN_"
     token_suffix: str = "]"
@@ -30,23 +63,47 @@ class TokenStore:
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
     _mapping: Dict[str, str] = field(default_factory=dict, init=False)
     _dirty_count: int = field(default=0, init=False)
+    _persisted_count: int = field(default=0, init=False)
+    _log_entries: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
         if self.store_path:
             self.store_path.parent.mkdir(parents=True, exist_ok=True)
             if self.store_path.exists():
-                with self.store_path.open("r", encoding="utf-8") as handle:
-                    data = json.load(handle)
-                    if isinstance(data, dict):
-                        self._mapping = data
+                data = _loads(self.store_path.read_bytes())
+                if isinstance(data, dict):
+                    self._mapping = data
+            self._replay_log()
+            self._persisted_count = len(self._mapping)
+
+    @property
+    def log_path(self) -> Path | None:
+        return self.store_path.with_name(self.store_path.name + ".jsonl") if self.store_path else None
+
+    def _replay_log(self) -> None:
+        log_path = self.log_path
+        if not log_path.exists():
+            return
+        with log_path.open("rb") as handle:
+            for line in handle:
+                try:
+                    value, token = _loads(line)
+                except ValueError:
+                    continue  # torn final line from an interrupted append
+                self._mapping.setdefault(value, token)
+                self._log_entries += 1
 
     def _make_token(self, value: str) -> str:
         encoded = self.encoder(value)
         return f"{self.token_prefix}{encoded}{self.token_suffix}"
 
     def get_token(self, value: str) -> str:
+        # Hits skip the lock: dict.get is atomic, and entries are never removed or changed
+        token = self._mapping.get(value)
+        if token is not None:
+            return token
         with self._lock:
-            token = self._mapping.get(value)
+            token = self._mapping.get(value)  # re-check: another thread may have minted it
             if token is None:
                 token = self._make_token(value)
                 self._mapping[value] = token
@@ -57,6 +114,27 @@ class TokenStore:
                     self._dirty_count = 0
             return token
 
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def snapshot(self, since: int = 0) -> Dict[str, str]:
+        """Copy of the mapping, optionally only the entries added after the first `since`."""
+        with self._lock:
+            if not since:
+                return dict(self._mapping)
+            return dict(islice(self._mapping.items(), since, None))
+
+    def merge(self, mapping: Dict[str, str]) -> None:
+        """Adopt tokens minted elsewhere (e.g. by worker processes), keeping existing ones."""
+        with self._lock:
+            for value, token in mapping.items():
+                if value not in self._mapping:
+                    self._mapping[value] = token
+                    self._dirty_count += 1
+            if self._dirty_count >= self.persist_batch_size:
+                self._persist()
+                self._dirty_count = 0
+
     def flush(self) -> None:
         """Force immediate persistence of all pending changes."""
         with self._lock:
@@ -64,8 +142,37 @@ class TokenStore:
                 self._persist()
                 self._dirty_count = 0
 
+    def compact(self) -> None:
+        """Fold the append-only log into the snapshot and truncate the log."""
+        with self._lock:
+            self._persist()
+            self._dirty_count = 0
+            self._compact()
+
     def _persist(self) -> None:
         if not self.store_path:
             return
-        with self.store_path.open("w", encoding="utf-8") as handle:
-            json.dump(self._mapping, handle, indent=2, sort_keys=True)
+        if self._persisted_count < len(self._mapping):
+            # Append only the entries added since the last write; dicts keep insertion order
+            pending = islice(self._mapping.items(), self._persisted_count, None)
+            lines = [_encode_log_entry(entry) for entry in pending]
+            with self.log_path.open("ab") as handle:
+                handle.write(b"".join(lines))
+            self._persisted_count = len(self._mapping)
+            self._log_entries += len(lines)
+        if self._log_entries >= max(COMPACT_MIN_LOG_ENTRIES, len(self._mapping) - self._log_entries):
+            self._compact()
+
+    def _compact(self) -> None:
+        if not self.store_path or not self._log_entries:
+            return
+        # Write-then-rename so a crash never leaves a half-written snapshot
+        staging = self.store_path.with_name(self.store_path.name + ".tmp")
+        if orjson is not None:
+            staging.write_bytes(orjson.dumps(self._mapping, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        else:
+            with staging.open("w", encoding="utf-8") as handle:
+                json.dump(self._mapping, handle, indent=2, sort_keys=True)
+        os.replace(staging, self.store_path)
+        self.log_path.unlink(missing_ok=True)
+        self._log_entries = 0
@@ -4,7 +4,9 @@ Input validation utilities for log records.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 from .log_format import LogFormatConfig, has_required_log_fields
 
@@ -36,35 +38,88 @@ def validate_record(
         return False, f"Record too large: {len(record)} bytes (max 1MB)"
     
     if isinstance(record, dict):
-        # Check for excessive nesting (potential DoS)
-        if _depth(record) > 20:
-            return False, f"Record nesting too deep: {_depth(record)} levels (max 20)"
-        
-        # Check for suspiciously large dicts
-        if len(record) > 10_000:
-            return False, f"Record has too many keys: {len(record)} (max 10,000)"
-        
-        # Require at least timestamp-like and message-like fields (via aliases/mapping)
-        ok, err = has_required_log_fields(record, log_format_config)
-        if not ok and err:
-            return False, err
+        return _validate_dict(record, log_format_config)
     
     return True, None
 
 
+def _validate_dict(record: Dict[str, Any], log_format_config: Optional[LogFormatConfig]) -> tuple[bool, str | None]:
+    # Check for excessive nesting (potential DoS)
+    depth = _depth(record)
+    if depth > 20:
+        return False, f"Record nesting too deep: {depth} levels (max 20)"
+
+    # Check for suspiciously large dicts
+    if len(record) > 10_000:
+        return False, f"Record has too many keys: {len(record)} (max 10,000)"
+
+    # Require at least timestamp-like and message-like fields (via aliases/mapping)
+    ok, err = has_required_log_fields(record, log_format_config)
+    if not ok and err:
+        return False, err
+    return True, None
+
+
+def validate_records(
+    records: Sequence[Any],
+    strict: bool = False,
+    log_format_config: Optional[LogFormatConfig] = None,
+) -> tuple[np.ndarray, List[str | None]]:
+    """
+    Validate every record of a chunk in one call.
+
+    Dict records, the common case, go straight to the dict checks; anything else
+    falls back to `validate_record`.
+
+    Returns:
+        (valid_mask, errors) where errors[i] is None for valid records
+    """
+    valid_mask = np.ones(len(records), dtype=np.bool_)
+    errors: List[str | None] = [None] * len(records)
+    for index, record in enumerate(records):
+        if type(record) is dict:
+            ok, err = _validate_dict(record, log_format_config)
+        else:
+            ok, err = validate_record(record, strict, log_format_config)
+        if not ok:
+            valid_mask[index] = False
+            errors[index] = err
+    return valid_mask, errors
+
+
 def _depth(obj: Any, current: int = 0, max_depth: int = 20) -> int:
-    """Calculate maximum nesting depth of a nested structure."""
-    if current > max_depth:
-        return current
-    if isinstance(obj, dict):
-        if not obj:
-            return current
-        return max(_depth(v, current + 1, max_depth) for v in obj.values())
-    if isinstance(obj, (list, tuple)):
-        if not obj:
-            return current
-        return max(_depth(item, current + 1, max_depth) for item in obj)
-    return current
+    """
+    Calculate maximum nesting depth of a nested structure.
+
+    Iterative depth-first walk; returns as soon as a node sits deeper than
+    ``max_depth`` (that depth is the result, as with the former recursion).
+    Scalar leaves only raise the depth of their container and are never pushed.
+    """
+    deepest = current
+    stack = [(obj, current)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, depth = pop()
+        if depth > deepest:
+            deepest = depth
+        if isinstance(node, dict):
+            children = node.values()
+        elif isinstance(node, (list, tuple)):
+            children = node
+        else:
+            continue
+        if not children:
+            continue
+        child_depth = depth + 1
+        if child_depth > max_depth:
+            return child_depth
+        if child_depth > deepest:
+            deepest = child_depth
+        for child in children:
+            if isinstance(child, (dict, list, tuple)):
+                push((child, child_depth))
+    return deepest
 
 
 def validate_batch(records: List[Any], max_records: int = 1_000_000) -> tuple[bool, str | None]:
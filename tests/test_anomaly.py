@@ -0,0 +1,34 @@
+import numpy as np
+
+from logminer_qa.anomaly import AnomalyDetector, top_k_descending
+
+
+def _batch(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(64, 8))
+
+
+def test_second_batch_of_same_shape_is_scored_on_its_own_fit():
+    reused = AnomalyDetector()
+    reused.score_embeddings(_batch(0))
+    second = reused.score_embeddings(_batch(1))
+    fresh = AnomalyDetector().score_embeddings(_batch(1))
+    assert second.scores == fresh.scores
+    assert second.threshold == fresh.threshold
+
+
+def test_reuse_model_scores_with_the_prior_fit():
+    detector = AnomalyDetector()
+    detector.fit(_batch(0))
+    reused = detector.score_embeddings(_batch(1), reuse_model=True)
+    fresh = AnomalyDetector().score_embeddings(_batch(1))
+    assert reused.scores != fresh.scores
+
+
+
+def test_top_k_descending_matches_a_stable_sort_with_ties():
+    rng = np.random.default_rng(3)
+    for _ in range(500):
+        values = rng.integers(0, 6, size=int(rng.integers(1, 40))).astype(float)
+        k = int(rng.integers(1, values.size + 1))
+        expected = np.argsort(-values, kind="stable")[:k]
+        assert top_k_descending(values, k).tolist() == expected.tolist()
@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+
+from logminer_qa.connectors import base, datadog, elk
+from logminer_qa.connectors.base import ConnectorConfig, PrefetchIterator, _islice_batches, batched
+from logminer_qa.connectors.datadog import DatadogConnector
+from logminer_qa.connectors.elk import ElasticsearchConnector
+
+
+def test_batched_yields_lists_with_a_short_tail():
+    assert list(batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(_islice_batches(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_batched_rejects_non_positive_sizes(size):
+    with pytest.raises(ValueError):
+        batched([1, 2, 3], size)
+
+
+def test_default_now_is_shared_within_ttl_and_refreshed_after(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(base.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(base, "_default_now_cache", (float("-inf"), ""))
+    first = base._default_now()
+    assert first and base._default_now() == first
+    checked_at, value = base._default_now_cache
+    assert (checked_at, value) == (1000.0, first)
+    clock[0] += base.DEFAULT_TIMESTAMP_TTL_SECONDS
+    base._default_now()
+    assert base._default_now_cache[0] == clock[0]
+
+
+def test_prefetch_close_stops_the_producer_and_closes_the_source():
+    produced = []
+    closed = threading.Event()
+
+    def source():
+        try:
+            for value in range(1000):
+                produced.append(value)
+                yield value
+        finally:
+            closed.set()
+
+    stream = PrefetchIterator(source(), maxsize=2)
+    assert next(stream) == 0
+    stream.close()
+    assert not stream._thread.is_alive()
+    assert closed.is_set()
+    assert len(produced) < 10
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    instances = []
+
+    def __init__(self):
+        self.headers = {}
+        self.closed = False
+        self.pages = [
+            {"data": [{"content": {"message": "one"}}], "meta": {"page": {"after": "c1"}}},
+            {"data": [{"content": {"message": "two"}}], "meta": {"page": {}}},
+        ]
+        _FakeSession.instances.append(self)
+
+    def post(self, url, json, timeout):
+        return _FakeResponse(self.pages.pop(0))
+
+    def close(self):
+        self.closed = True
+
+
+def test_datadog_fetch_closes_its_session(monkeypatch):
+    monkeypatch.setattr(datadog.requests, "Session", _FakeSession)
+    config = ConnectorConfig(name="dd", options={"api_key": "a", "app_key": "b", "query": "service:x"})
+    records = list(DatadogConnector(config).fetch())
+    assert [record["message"] for record in records] == ["one", "two"]
+    session = _FakeSession.instances[-1]
+    assert session.closed
+    assert "Accept-Encoding" not in session.headers
+
+
+class _FakeSearchResponse(_FakeResponse):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _FakeElasticSession:
+    def __init__(self, total):
+        self.headers = {}
+        self.total = total
+        self.served = 0
+        self.posts = []
+        self.deleted = []
+
+    def post(self, url, json, timeout, verify, stream, params=None):
+        self.posts.append((url, params))
+        size = params["size"] if params else 2
+        end = min(self.total, self.served + size)
+        hits = [{"_id": str(i), "_source": {"message": f"m{i}"}} for i in range(self.served, end)]
+        self.served += len(hits)
+        payload = {"hits": {"hits": hits}}
+        if params is None or "scroll" in params:
+            payload["_scroll_id"] = "sid"
+        return _FakeSearchResponse(payload)
+
+    def delete(self, url, json, timeout, verify):
+        self.deleted.append(json)
+
+    def close(self):
+        pass
+
+
+def _elk(monkeypatch, total, **options):
+    session = _FakeElasticSession(total)
+    monkeypatch.setattr(elk, "ijson", None)
+    monkeypatch.setattr(elk.requests, "Session", lambda: session)
+    options = {"endpoint": "http://es", "index": "logs", "page_size": 2, **options}
+    config = ConnectorConfig(name="elk", options=options)
+    return session, [record["message"] for record in ElasticsearchConnector(config).fetch()]
+
+
+def test_elk_fetches_one_page_without_a_scroll_context_by_default(monkeypatch):
+    session, messages = _elk(monkeypatch, total=7)
+    assert messages == ["m0", "m1"]
+    assert session.posts == [("http://es/logs/_search", {"size": 2})]
+    assert session.deleted == []
+
+
+def test_elk_scrolls_up_to_max_docs_and_everything_when_unbounded(monkeypatch):
+    session, messages = _elk(monkeypatch, total=7, max_docs=5)
+    assert messages == ["m0", "m1", "m2", "m3", "m4"]
+    assert session.deleted == [{"scroll_id": ["sid"]}]
+    _, messages = _elk(monkeypatch, total=7, max_docs=None)
+    assert len(messages) == 7
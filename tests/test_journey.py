@@ -0,0 +1,10 @@
+from logminer_qa.journey import JourneyAnalyzer, JourneyModelConfig
+
+
+def test_hidden_layers_default_to_float32():
+    assert JourneyAnalyzer()._layer_policy() == "float32"
+
+
+def test_mixed_precision_is_opt_in():
+    analyzer = JourneyAnalyzer(config=JourneyModelConfig(mixed_precision="mixed_bfloat16"))
+    assert analyzer._layer_policy() == "mixed_bfloat16"
@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+
+from logminer_qa.anomaly import AnomalyDetector
+from logminer_qa.ci import generate_summary
+from logminer_qa.cli import _write_sanitized_logs
+from logminer_qa.embeddings import EmbeddingService
+from logminer_qa.pipeline import LogMinerPipeline
+
+
+class _HalfPrecisionEmbeddings(EmbeddingService):
+    def embed_texts(self, texts, **kwargs):
+        rng = np.random.default_rng(len(texts))
+        return rng.normal(size=(len(texts), 8)).astype(np.float16)
+
+
+class _RecordingAnomaly:
+    def __init__(self, detector):
+        self.detector = detector
+        self.dtypes = []
+
+    def __getattr__(self, name):
+        return getattr(self.detector, name)
+
+    def score_embeddings(self, embeddings, **kwargs):
+        self.dtypes.append(embeddings.dtype)
+        return self.detector.score_embeddings(embeddings, **kwargs)
+
+
+def _records(count: int = 30) -> list:
+    return [
+        {
+            "timestamp": f"2024-01-02T03:04:{idx % 60:02d}Z",
+            "message": f"transfer {idx} completed for customer{idx}@bank.example",
+            "event": "transfer_confirm",
+            "session_id": f"s{idx % 5}",
+        }
+        for idx in range(count)
+    ]
+
+
+def test_embedding_dtype_reaches_anomaly_scoring_unchanged():
+    recorder = _RecordingAnomaly(AnomalyDetector())
+    pipeline = LogMinerPipeline(embeddings=_HalfPrecisionEmbeddings(), anomaly=recorder)
+    pipeline.process_logs(_records())
+    assert recorder.dtypes == [np.float16]
+
+
+def test_artifact_records_serialize_with_plain_embedding_lists(tmp_path):
+    artifact = LogMinerPipeline(embeddings=_HalfPrecisionEmbeddings()).process_logs(_records())
+    for parsed in artifact.parsed_records:
+        assert type(parsed["embedding"]) is list
+        assert all(type(value) is float for value in parsed["embedding"])
+    json.loads(json.dumps(artifact.parsed_records))
+    json.loads(json.dumps(artifact.sanitized_logs))
+    json.loads(json.dumps(generate_summary(artifact).to_dict()))
+
+    output = tmp_path / "sanitized.jsonl"
+    _write_sanitized_logs(artifact.sanitized_logs, output)
+    written = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert written == json.loads(json.dumps(artifact.sanitized_logs))
+
+
+def test_generate_tests_keeps_one_scenario_per_distinct_journey():
+    pipeline = LogMinerPipeline(embeddings=_HalfPrecisionEmbeddings())
+    journeys = {
+        "a": ["login", "login", "transfer"],
+        "b": ["login", "transfer", "transfer"],
+        "c": ["transfer", "login"],
+        "d": ["login\x00transfer"],
+    }
+    scenarios = pipeline._generate_tests(journeys, [], [])
+    assert len(scenarios) == 3
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+
+from logminer_qa._records import record_epoch_us, to_soa
+from logminer_qa.connectors import ConnectorConfig, JSONLinesConnector
+
+
+def test_naive_timestamps_stay_on_wall_clock_time():
+    expected = (datetime(2024, 1, 2, 3, 4, 5) - datetime(1970, 1, 1)).total_seconds() * 1_000_000
+    assert record_epoch_us({"timestamp": "2024-01-02T03:04:05"}) == expected
+
+
+def test_aware_timestamps_use_utc_epoch():
+    expected = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc).timestamp() * 1_000_000
+    assert record_epoch_us({"timestamp": "2024-01-02T03:04:05Z"}) == expected
+    assert record_epoch_us({"timestamp": "2024-01-02T05:04:05+02:00"}) == expected
+
+
+def test_precomputed_epochs_match_parsing():
+    records = [
+        {"timestamp": "2024-01-02T03:04:05", "message": "a"},
+        {"timestamp": "2024-01-02T03:04:05.250000Z", "message": "b"},
+        {"timestamp": "not a time", "message": "c"},
+        {"message": "d"},
+    ]
+    parsed = [{"monetary_values": []} for _ in records]
+    reparsed = to_soa(records, parsed)
+    reused = to_soa(records, parsed, [record_epoch_us(record) for record in records])
+    assert reparsed["ts_us"].tolist() == reused["ts_us"].tolist()
+    assert reparsed["ts_valid"].tolist() == reused["ts_valid"].tolist() == [True, True, False, False]
+
+
+def test_connectors_do_not_add_fields_beyond_the_documented_ones(tmp_path):
+    path = tmp_path / "logs.jsonl"
+    path.write_text('{"timestamp": "2024-01-02T03:04:05Z", "message": "hello"}\n', encoding="utf-8")
+    connector = JSONLinesConnector(ConnectorConfig(name="local", options={"path": str(path)}))
+    (record,) = list(connector.fetch())
+    assert set(record) == {"timestamp", "message", "metadata", "source"}
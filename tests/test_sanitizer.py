@@ -0,0 +1,218 @@
+import hashlib
+import json
+import random
+import re
+import time
+from hashlib import blake2b
+
+import pytest
+
+from logminer_qa.sanitizer import SPAN_BUCKET_THRESHOLD, PatternDetector, SanitizationLayer
+
+REFERENCE_SECRET = "reference-secret"
+
+
+def _build_corpus(seed: int = 7, size: int = 400) -> list:
+    rng = random.Random(seed)
+    fragments = [
+        "customer jane.doe+alerts@bank-mail.co.uk logged in",
+        "card 4111 1111 1111 1111 declined",
+        "card 4111-1111-1111-1111",
+        "acct 123456789012 balance 25.10",
+        "IBAN GB82WEST12345698765432 verified",
+        "call +447911123456 or 07911123456",
+        "ssn 123-45-6789 on file",
+        "order 12345 shipped",
+        "retry 3 of 5 at 10:42:07",
+        "x@y",
+        "a@b.c",
+        "1234567890123456789012345",
+        "id_9876543210_suffix",
+        "plain message without identifiers",
+        "",
+        "digits 12 34 56 78 90 12 34",
+        "GB82 WEST 1234",
+        "mixed a1@b2.c3 and 555-12-1234",
+    ]
+    corpus = list(fragments)
+    for _ in range(size):
+        corpus.append(" ".join(rng.choice(fragments) for _ in range(rng.randint(1, 4))))
+        corpus.append("".join(rng.choice("0123456789 -@.+abcXYZ") for _ in range(rng.randint(1, 40))))
+    return corpus
+
+
+PII_CORPUS = _build_corpus()
+
+
+def test_custom_patterns_keep_numbered_backreferences():
+    detector = PatternDetector(patterns=[("A", r"(x)y"), ("B", r"(q)\1")])
+    assert detector.find_matches("zz qq zz") == [("B", (3, 5))]
+
+
+def test_custom_patterns_skip_hyperscan_prescan():
+    detector = PatternDetector(patterns=[("A", r"(?<=id=)\d{4}")])
+    assert detector._prescan is None
+    assert detector.find_matches("id=1234") == [("A", (3, 7))]
+
+
+def test_hyperscan_prescan_agrees_with_re_on_default_patterns():
+    pytest.importorskip("hyperscan")
+    gated = PatternDetector()
+    assert gated._prescan is not None
+    plain = PatternDetector()
+    plain._prescan = None
+    for text in PII_CORPUS:
+        assert gated.find_matches(text) == plain.find_matches(text), text
+
+
+def test_sanitize_json_lines_writes_stdlib_json_for_every_line():
+    lines = [
+        '{"u": "caf\\u00e9 jane@bank.example", "x": 1e16, "f": 0.00001}',
+        '{"a": NaN, "m": "x@y.com"}',
+        '{"big": 123456789012345678901234567890}',
+        "not json 4111111111111111",
+        "   ",
+    ]
+    layer = SanitizationLayer()
+    output = list(layer.sanitize_json_lines(lines))
+    assert len(output) == 4
+    for line in output:
+        assert line == json.dumps(json.loads(line))
+    assert '"big": 123456789012345678901234567890' in output[2]
+
+
+def test_credit_card_pattern_stays_linear_on_digit_runs():
+    detector = PatternDetector()
+    started = time.perf_counter()
+    matches = detector.find_matches("1" * 200)
+    credit_card = dict(detector._compiled)["CREDIT_CARD"]
+    long_run = list(credit_card.finditer("1" * 1_000_000))
+    elapsed = time.perf_counter() - started
+    assert elapsed < 1.0
+    assert {label for label, _ in matches} == {"PHONE"}
+    assert matches[:2] == [("PHONE", (0, 15)), ("PHONE", (15, 30))]
+    assert long_run == []
+
+
+def test_credit_card_pattern_spans_digits_only():
+    detector = PatternDetector()
+    assert detector.find_matches("card 4111 1111 1111 1111 ok") == [("CREDIT_CARD", (5, 24))]
+    assert detector.find_matches("card 4111-1111--1111-1111 ok") == [("CREDIT_CARD", (5, 25))]
+
+
+def _reference_spans(text: str) -> list:
+    """Per-pattern ``re.finditer`` plus the longest-window sorted sweep, as originally written."""
+    spans = [
+        (label, match.span())
+        for label, pattern in PatternDetector().patterns
+        for match in re.finditer(pattern, text)
+    ]
+    deduped = []
+    for label, span in sorted(spans, key=lambda item: (item[1][0], -(item[1][1] - item[1][0]))):
+        if not deduped or span[0] >= deduped[-1][1][1]:
+            deduped.append((label, span))
+    return deduped
+
+
+def _reference_token(value: str) -> str:
+    return f"[TOKEN_{blake2b(value.encode('utf-8'), digest_size=12).hexdigest().upper()}]"
+
+
+def _reference_hash(value: str) -> str:
+    digest = hashlib.new("sha256")
+    digest.update(REFERENCE_SECRET.encode("utf-8"))
+    digest.update(value.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _reference_sanitize_text(text: str, prefix: str | None) -> tuple:
+    redactions, hashed, fragments, cursor = {}, {}, [], 0
+    for label, (start, end) in _reference_spans(text):
+        fragments.append(text[cursor:start])
+        token = _reference_token(text[start:end])
+        fragments.append(token)
+        key = token if prefix is None else f"{prefix}.{token}"
+        redactions[key] = label
+        hashed[key] = _reference_hash(text[start:end])
+        cursor = end
+    fragments.append(text[cursor:])
+    return "".join(fragments), redactions, hashed
+
+
+def _reference_sanitize(record):
+    if isinstance(record, str):
+        text, redactions, hashed = _reference_sanitize_text(record, None)
+        return {"message": text, "redactions": redactions, "hashed_fields": hashed}
+    cloned = json.loads(json.dumps(record))
+    redactions, hashed = {}, {}
+
+    def walk(node, path):
+        if isinstance(node, str):
+            text, node_redactions, node_hashed = _reference_sanitize_text(node, ".".join(path) or None)
+            redactions.update(node_redactions)
+            hashed.update(node_hashed)
+            return text
+        if isinstance(node, dict):
+            return {key: walk(value, (*path, key)) for key, value in node.items()}
+        if isinstance(node, list):
+            return [walk(value, (*path, str(idx))) for idx, value in enumerate(node)]
+        return node
+
+    cloned = walk(cloned, ())
+    if isinstance(cloned, dict):
+        cloned.setdefault("redactions", {}).update(redactions)
+        cloned.setdefault("hashed_fields", {}).update(hashed)
+    return cloned
+
+
+def _nested_records() -> list:
+    return [
+        {"message": text, "meta": {"notes": [text, 5, None], 3: text.upper()}, "pair": (text, 1.5)}
+        for text in PII_CORPUS
+    ]
+
+
+@pytest.fixture
+def reference_secret(monkeypatch):
+    monkeypatch.setenv("LOGMINER_HASH_SECRET", REFERENCE_SECRET)
+
+
+def test_sanitize_record_matches_reference_on_pii_corpus(reference_secret):
+    layer = SanitizationLayer()
+    for text in PII_CORPUS:
+        assert layer.sanitize_record(text).sanitized == _reference_sanitize(text), text
+    for record in _nested_records():
+        assert layer.sanitize_record(record).sanitized == _reference_sanitize(record), record["message"]
+
+
+def test_span_buckets_select_the_same_spans_as_the_sorted_sweep():
+    layer = SanitizationLayer()
+    long_text = " | ".join(PII_CORPUS)
+    assert len(layer.pattern_detector.find_matches(long_text)) > SPAN_BUCKET_THRESHOLD
+    assert layer._collect_spans(long_text) == _reference_spans(long_text)
+
+    rng = random.Random(11)
+    labels = ("A", "B", "C")
+    for _ in range(500):
+        spans = []
+        for _ in range(rng.randint(1, 120)):
+            start = rng.randint(0, 60)
+            spans.append((rng.choice(labels), (start, start + rng.randint(1, 8))))
+        swept = []
+        for label, span in sorted(spans, key=lambda item: (item[1][0], -(item[1][1] - item[1][0]))):
+            if not swept or span[0] >= swept[-1][1][1]:
+                swept.append((label, span))
+        assert SanitizationLayer._sweep_span_buckets(spans) == swept
+
+
+def test_sanitize_many_across_workers_matches_in_process(reference_secret):
+    records = _nested_records()
+    in_process = SanitizationLayer()
+    expected = [result.sanitized for result in in_process.sanitize_many(records, workers=1)]
+    pooled = SanitizationLayer()
+    pooled.token_store.get_token("seeded before the pool")
+    results = [result.sanitized for result in pooled.sanitize_many(records, workers=2, batch_size=64)]
+    assert results == expected
+    merged = pooled.token_store.snapshot()
+    merged.pop("seeded before the pool")
+    assert merged == in_process.token_store.snapshot()
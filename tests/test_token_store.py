@@ -0,0 +1,55 @@
+import json
+from hashlib import blake2b
+
+from logminer_qa.token_store import TokenStore
+
+
+def _reference_token(value: str) -> str:
+    return f"[TOKEN_{blake2b(value.encode('utf-8'), digest_size=12).hexdigest().upper()}]"
+
+
+VALUES = [f"customer{idx}@bank.example" for idx in range(250)] + ["café ☃", ""]
+
+
+def test_tokens_match_the_original_encoder():
+    store = TokenStore()
+    assert [store.get_token(value) for value in VALUES] == [_reference_token(value) for value in VALUES]
+    assert store.get_token(VALUES[0]) == _reference_token(VALUES[0])
+
+
+def test_flushed_tokens_replay_from_the_log_and_survive_compaction(tmp_path):
+    path = tmp_path / "tokens.json"
+    store = TokenStore(store_path=path, persist_batch_size=7)
+    tokens = {value: store.get_token(value) for value in VALUES}
+    store.flush()
+    assert store.log_path.exists()
+
+    reopened = TokenStore(store_path=path)
+    assert reopened.snapshot() == tokens
+
+    reopened.compact()
+    assert not reopened.log_path.exists()
+    assert json.loads(path.read_text(encoding="utf-8")) == tokens
+    assert TokenStore(store_path=path).snapshot() == tokens
+
+
+def test_snapshot_in_the_original_format_loads_and_torn_log_lines_are_skipped(tmp_path):
+    path = tmp_path / "tokens.json"
+    original = {value: _reference_token(value) for value in VALUES[:10]}
+    path.write_text(json.dumps(original, indent=2, sort_keys=True), encoding="utf-8")
+    store = TokenStore(store_path=path)
+    assert store.snapshot() == original
+
+    store.get_token("new value")
+    store.flush()
+    with store.log_path.open("ab") as handle:
+        handle.write(b'["torn", "[TOK')
+    reopened = TokenStore(store_path=path)
+    assert reopened.snapshot() == {**original, "new value": _reference_token("new value")}
+
+
+def test_merge_keeps_existing_tokens():
+    store = TokenStore()
+    existing = store.get_token("a")
+    store.merge({"a": "[TOKEN_OTHER]", "b": "[TOKEN_B]"})
+    assert store.snapshot() == {"a": existing, "b": "[TOKEN_B]"}
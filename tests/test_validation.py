@@ -0,0 +1,74 @@
+import random
+
+import numpy as np
+
+from logminer_qa.validation import _depth, validate_record, validate_records
+
+
+def _recursive_depth(obj, current=0, max_depth=20):
+    if current > max_depth:
+        return current
+    if isinstance(obj, dict):
+        if not obj:
+            return current
+        return max(_recursive_depth(v, current + 1, max_depth) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        if not obj:
+            return current
+        return max(_recursive_depth(item, current + 1, max_depth) for item in obj)
+    return current
+
+
+def _random_tree(rng: random.Random, budget: int):
+    kind = rng.random()
+    if budget <= 0 or kind < 0.3:
+        return rng.choice([1, "x", None, 2.5, [], {}, ()])
+    width = rng.randint(0, 3)
+    children = [_random_tree(rng, budget - rng.randint(1, 3)) for _ in range(width)]
+    if kind < 0.6:
+        return {f"k{idx}": child for idx, child in enumerate(children)}
+    if kind < 0.8:
+        return children
+    return tuple(children)
+
+
+def _nested(levels: int) -> dict:
+    record = {"timestamp": "2024-01-01T00:00:00Z", "message": "deep"}
+    node = record
+    for _ in range(levels):
+        node["child"] = {}
+        node = node["child"]
+    return record
+
+
+def test_depth_matches_the_recursive_definition():
+    rng = random.Random(5)
+    for _ in range(2000):
+        tree = _random_tree(rng, rng.randint(0, 40))
+        assert _depth(tree) == _recursive_depth(tree)
+    for levels in (0, 19, 20, 21, 60):
+        assert _depth(_nested(levels)) == _recursive_depth(_nested(levels))
+
+
+def test_validate_records_matches_validate_record_per_item():
+    records = [
+        {"timestamp": "2024-01-01T00:00:00Z", "message": "ok"},
+        {"ts": "2024-01-01", "msg": "alias fields"},
+        {"message": "no timestamp"},
+        {"timestamp": "2024-01-01"},
+        {"timestamp": None, "message": "null timestamp"},
+        _nested(19),
+        _nested(25),
+        {f"k{idx}": idx for idx in range(10_001)},
+        "raw text line",
+        "x" * 1_000_001,
+        ["list", "record"],
+        None,
+        42,
+    ]
+    for strict in (False, True):
+        mask, errors = validate_records(records, strict=strict)
+        expected = [validate_record(record, strict=strict) for record in records]
+        assert mask.dtype == np.bool_
+        assert mask.tolist() == [ok for ok, _ in expected]
+        assert errors == [err for _, err in expected]